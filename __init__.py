@@ -213,6 +213,7 @@ def register():
         preset_handler.AutoLoadHandler,
         preset_handler.UpdateCrashCacheHandler,
         preset_handler.RestorePreviewMaterialsHandler,
+        prop_module.ClearEnumCacheHandler,
     ):
         try:
             handler_cls.register()
@@ -245,6 +246,8 @@ def unregister():
     preset_handler.AutoLoadHandler.unregister()
     preset_handler.UpdateCrashCacheHandler.unregister()
     preset_handler.RestorePreviewMaterialsHandler.unregister()
+    prop_module.ClearEnumCacheHandler.unregister()
+    preset_handler.shutdown_preset_io_pool()
 
     # 4. Menus
     bpy.types.VIEW3D_MT_object_context_menu.remove(menu_func_quick_bake)
@@ -3,33 +3,34 @@
 """Enum definitions, channel metadata, UI layout config, and system constants."""
 
 # --- UI Enum Definitions (Used in property.py) ---
+# Tuples: Blender keeps referencing these item sequences, so they must not change.
 
-JOB_TYPES = [
+JOB_TYPES = (
     ("S", "Simple", "Simple Jobs Setting", 1),
     ("A", "Accurate", "Accurate Jobs Setting", 2),
-]
+)
 
-CUSTOM_CHANNEL_SEP = [
+CUSTOM_CHANNEL_SEP = (
     ("R", "Red", "Use Red channel", 1),
     ("G", "Green", "Use Green channel", 2),
     ("B", "Blue", "Use Blue channel", 3),
     ("A", "Alpha", "Use Alpha channel", 4),
-]
+)
 
-BAKE_TYPES = [
+BAKE_TYPES = (
     ("BASIC", "Basic Bake", "Blender Default Baking", 1),
     ("BSDF", "BSDF Bake", "Use BSDF Baking (requires Principled BSDF)", 2),
-]
+)
 
-BAKE_MODES = [
+BAKE_MODES = (
     ("SINGLE_OBJECT", "Single Object Bake", "Bake single object", 1),
     ("COMBINE_OBJECT", "Multi Objects Bake", "Bake multi objects", 2),
     ("SELECT_ACTIVE", "Active Bake", "Bake selected to active", 3),
     ("SPLIT_MATERIAL", "Split Material Bake", "Bake each split material", 4),
     ("UDIM", "UDIM Bake", "Bake selected objects to UDIM tiles", 5),
-]
+)
 
-BASIC_FORMATS = [
+BASIC_FORMATS = (
     ("BMP", "BMP", "Output image in bitmap format", 1),
     ("IRIS", "Iris", "Output image in SGI IRIS format", 2),
     ("PNG", "PNG", "Output image in PNG format", 3),
@@ -49,32 +50,32 @@ BASIC_FORMATS = [
     ("HDR", "Radiance HDR", "Output image in Radiance HDR format", 12),
     ("TIFF", "TIFF", "Output image in TIFF format", 13),
     ("WEBP", "WebP", "Output image in WebP format", 14),
-]
+)
 
-DEVICES = [("GPU", "GPU", "Use GPU"), ("CPU", "CPU", "Use CPU")]
-ATLAS_PACK_METHODS = [
+DEVICES = (("GPU", "GPU", "Use GPU"), ("CPU", "CPU", "Use CPU"))
+ATLAS_PACK_METHODS = (
     ("REPACK", "Smart Project", "Use Smart UV Project repack UV"),
     ("ISLAND", "Pack Island", "Pack UV island for current UV"),
-]
-DIRECTIONS = [("X", "X", "X"), ("Y", "Y", "Y"), ("Z", "Z", "Z")]
-NORMAL_TYPES = [
+)
+DIRECTIONS = (("X", "X", "X"), ("Y", "Y", "Y"), ("Z", "Z", "Z"))
+NORMAL_TYPES = (
     ("OPENGL", "OPENGL", "Use OPENGL Standard"),
     ("DIRECTX", "DIRECTX", "Use DIRECTX Standard"),
     ("CUSTOM", "Custom", "Use Custom Standard"),
-]
+)
 
 DEFAULT_BAKE_TARGET = "IMAGE_TEXTURES"
 
-NORMAL_CHANNELS = [
+NORMAL_CHANNELS = (
     ("POS_X", "+X", "+X"),
     ("POS_Y", "+Y", "+Y"),
     ("POS_Z", "+Z", "+Z"),
     ("NEG_X", "-X", "-X"),
     ("NEG_Y", "-Y", "-Y"),
     ("NEG_Z", "-Z", "-Z"),
-]
+)
 
-COLOR_DEPTHS = [
+COLOR_DEPTHS = (
     ("8", "8", "8 Bits"),
     ("10", "10", "10 Bits"),
     ("12", "12", "12 Bits"),
@@ -84,8 +85,8 @@ COLOR_DEPTHS = [
     ("0", "8", "Legacy 8-bit", "NONE", 0o1),
     ("1", "16", "Legacy 16-bit", "NONE", 0o2),
     ("2", "32", "Legacy 32-bit", "NONE", 0o3),
-]
-COLOR_MODES = [
+)
+COLOR_MODES = (
     ("RGBA", "RGBA", "RGB and Alpha channel"),
     ("RGB", "RGB", "RGB channel"),
     ("BW", "BW", "BW channel"),
@@ -93,20 +94,20 @@ COLOR_MODES = [
     ("0", "RGBA", "Legacy RGBA", "NONE", 3),
     ("1", "RGB", "Legacy RGB", "NONE", 4),
     ("2", "BW", "Legacy BW", "NONE", 5),
-]
-COLOR_SPACES = [
+)
+COLOR_SPACES = (
     ("NONCOL", "Non-Color", "Non-Color"),
     ("SRGB", "sRGB", "sRGB"),
     ("LINEAR", "Linear", "Linear"),
-]
+)
 
-TIFF_CODECS = [
+TIFF_CODECS = (
     ("NONE", "None", "No compression"),
     ("DEFLATE", "Deflate", "Deflate compression"),
     ("LZW", "LZW", "LZW compression"),
     ("PACKBITS", "Packbits", "Packbits compression"),
-]
-EXR_CODECS = [
+)
+EXR_CODECS = (
     ("NONE", "None", "No compression"),
     ("PXR24", "Pxr24", "Lossy"),
     ("ZIP", "ZIP", "Lossless"),
@@ -117,18 +118,18 @@ EXR_CODECS = [
     ("B44A", "B44A", "Lossy"),
     ("DWAA", "DWAA", "Lossy"),
     ("DWAB", "DWAB", "Lossy"),
-]
-DENOISE_METHODS = [
+)
+DENOISE_METHODS = (
     ("NONE", "No", "No Prefilter"),
     ("FAST", "Fast", "Fast"),
     ("ACCURATE", "Accurate", "Accurate"),
-]
-NAMING_MODES = [
+)
+NAMING_MODES = (
     ("OBJECT", "Object", "Object"),
     ("MAT", "Material", "Material"),
     ("OBJ_MAT", "Object-Material", "Obj-Mat"),
     ("CUSTOM", "Custom", "Custom"),
-]
+)
 
 # --- Image Format Technical Settings ---
 
@@ -219,6 +220,16 @@ FORMAT_SETTINGS = {
     },
 }
 
+# Shared fallback for unknown formats, so lookups never build an empty dict.
+UNKNOWN_FORMAT_SETTINGS = {"modes": frozenset(), "depths": frozenset()}
+
+# Freeze the key sets: they are shared, read-only lookup tables. Every entry
+# is guaranteed to carry "modes" and "depths", so callers can index directly.
+for _cfg in FORMAT_SETTINGS.values():
+    _cfg["modes"] = frozenset(_cfg.get("modes", ()))
+    _cfg["depths"] = frozenset(_cfg.get("depths", ()))
+del _cfg
+
 # --- Bake Channel Categories ---
 
 CAT_DATA = "DATA"
@@ -38,12 +38,7 @@ def log_error(
 
     logger.error(technical_msg)
 
-    if context and hasattr(context, "scene"):
-        log = context.scene.bake_error_log
-        max_log = 8000
-        if len(log) > max_log:
-            log = log[-max_log // 2:]
-        context.scene.bake_error_log = log + f"{message}\n"
+    append_error_log(context, message)
 
     if state_mgr:
         try:
@@ -52,6 +47,23 @@ def log_error(
             logger.debug(f"Failed to persist state error: {e}")
 
 
+def append_error_log(context: bpy.types.Context, text: str) -> None:
+    """Append text to the scene error log in one RNA write, trimming old history.
+
+    Args:
+        context: Blender context for scene access.
+        text: One or more newline-separated messages.
+    """
+    if not text or not context or not hasattr(context, "scene"):
+        return
+    # Cap the combined result: a flushed batch can be long on its own.
+    log = context.scene.bake_error_log + f"{text}\n"
+    max_log = 8000
+    if len(log) > max_log:
+        log = log[-max_log // 2:]
+    context.scene.bake_error_log = log
+
+
 def get_safe_base_name(
     setting: Any,
     obj: bpy.types.Object,
@@ -139,8 +151,13 @@ def reset_channels_logic(setting: Any) -> None:
     for i in range(len(setting.channels) - 1, -1, -1):
         c = setting.channels[i]
         if c.id in target_ids:
-            c.valid_for_mode = True
-            c.name = target_ids[c.id]["name"]
+            # Only write on change: each write fires the channel update
+            # callbacks and invalidates the cached source enum items.
+            if not c.valid_for_mode:
+                c.valid_for_mode = True
+            name = target_ids[c.id]["name"]
+            if c.name != name:
+                c.name = name
         else:
             setting.channels.remove(i)
 
@@ -176,13 +193,20 @@ def manage_objects_logic(
         act: Active object (for SELECT_ACTIVE mode). Defaults to None.
     """
 
+    # Object pointers already in the list, so add() does not rescan the
+    # collection per object. Pointers, not names: linked objects from
+    # different libraries can share a name.
+    existing = set()
+
     def add(o):
-        if not any(i.bakeobject == o for i in s.bake_objects):
+        key = o.as_pointer()
+        if key not in existing:
             from .uv_manager import detect_object_udim_tile
 
             new = s.bake_objects.add()
             new.bakeobject = o
             new.udim_tile = detect_object_udim_tile(o)
+            existing.add(key)
 
     if action == "SET":
         s.bake_objects.clear()
@@ -193,15 +217,38 @@ def manage_objects_logic(
         for o in targets:
             add(o)
     elif action == "ADD":
+        existing.update(b.bakeobject.as_pointer() for b in s.bake_objects if b.bakeobject)
         for o in sel:
             if s.bake_mode == "SELECT_ACTIVE" and o == s.active_object:
                 continue
             add(o)
     elif action == "REMOVE":
-        rem = set(sel)
-        for i in range(len(s.bake_objects) - 1, -1, -1):
-            if s.bake_objects[i].bakeobject in rem:
-                s.bake_objects.remove(i)
+        # Rebuild in one pass (like SET) instead of remove(i), which shifts
+        # the RNA collection on every call. Match by pointer: linked objects
+        # from different libraries can share a name. Entries whose object
+        # was deleted are kept, as before.
+        rem = {o.as_pointer() for o in sel}
+        survivors = [
+            (
+                b.bakeobject,
+                b.udim_tile,
+                b.override_size,
+                b.udim_width,
+                b.udim_height,
+            )
+            for b in s.bake_objects
+            if not b.bakeobject or b.bakeobject.as_pointer() not in rem
+        ]
+        if len(survivors) == len(s.bake_objects):
+            return
+        s.bake_objects.clear()
+        for o, tile, override, width, height in survivors:
+            new = s.bake_objects.add()
+            new.bakeobject = o
+            new.udim_tile = tile
+            new.override_size = override
+            new.udim_width = width
+            new.udim_height = height
     elif action == "CLEAR":
         s.bake_objects.clear()
     elif action == "SET_ACTIVE":
@@ -216,6 +263,22 @@ def manage_objects_logic(
                 add(o)
 
 
+# Target name -> (collection, index property, owner) resolver, built once.
+_CHANNEL_TARGETS = {
+    "jobs_channel": lambda bj, job: (bj.jobs, "job_index", bj),
+    "job_custom_channel": lambda bj, job: (
+        (job.custom_bake_channels, "custom_bake_channels_index", job)
+        if job
+        else None
+    ),
+    "bake_objects": lambda bj, job: (
+        (job.setting.bake_objects, "active_object_index", job.setting)
+        if job
+        else None
+    ),
+}
+
+
 def manage_channels_logic(
     target: str, action_type: str, bj: Any
 ) -> Tuple[bool, str]:
@@ -229,6 +292,10 @@ def manage_channels_logic(
     Returns:
         Tuple of (success: bool, error_message: str).
     """
+    resolver = _CHANNEL_TARGETS.get(target)
+    if resolver is None:
+        return False, f"Invalid target: {target}"
+
     job_index = bj.job_index if bj.jobs else -1
     if job_index < 0 or job_index >= len(bj.jobs):
         job_index = 0 if bj.jobs else -1
@@ -236,21 +303,7 @@ def manage_channels_logic(
         bj.job_index = job_index
     job = bj.jobs[job_index] if 0 <= job_index < len(bj.jobs) else None
 
-    dispatch = {
-        "jobs_channel": (bj.jobs, "job_index", bj),
-        "job_custom_channel": (
-            job.custom_bake_channels,
-            "custom_bake_channels_index",
-            job,
-        )
-        if job
-        else None,
-        "bake_objects": (job.setting.bake_objects, "active_object_index", job.setting)
-        if job
-        else None,
-    }
-
-    entry = dispatch.get(target)
+    entry = resolver(bj, job)
     if not entry:
         return False, f"Invalid target: {target}"
 
@@ -277,6 +330,48 @@ def manage_channels_logic(
     return success, ""
 
 
+def _collection_add(collection, index, parent_obj, index_prop):
+    return True, collection.add()
+
+
+def _collection_delete(collection, index, parent_obj, index_prop):
+    if len(collection) > 0 and 0 <= index < len(collection):
+        collection.remove(index)
+        if parent_obj and index_prop:
+            setattr(parent_obj, index_prop, max(0, index - 1))
+        return True, None
+    return False, None
+
+
+def _collection_clear(collection, index, parent_obj, index_prop):
+    collection.clear()
+    if parent_obj and index_prop:
+        setattr(parent_obj, index_prop, 0)
+    return True, None
+
+
+def _collection_move(offset):
+    def move(collection, index, parent_obj, index_prop):
+        target_idx = index + offset
+        if not 0 <= target_idx < len(collection) or index >= len(collection):
+            return False, None
+        collection.move(index, target_idx)
+        if parent_obj and index_prop:
+            setattr(parent_obj, index_prop, target_idx)
+        return True, None
+
+    return move
+
+
+_COLLECTION_ACTIONS = {
+    "ADD": _collection_add,
+    "DELETE": _collection_delete,
+    "CLEAR": _collection_clear,
+    "UP": _collection_move(-1),
+    "DOWN": _collection_move(1),
+}
+
+
 def manage_collection_item(
     collection: Any,
     action: str,
@@ -296,31 +391,10 @@ def manage_collection_item(
     Returns:
         Tuple of (success, item_or_None).
     """
-    if action == "ADD":
-        return True, collection.add()
-    elif action == "DELETE":
-        if len(collection) > 0 and 0 <= index < len(collection):
-            collection.remove(index)
-            if parent_obj and index_prop:
-                setattr(parent_obj, index_prop, max(0, index - 1))
-            return True, None
-    elif action == "CLEAR":
-        collection.clear()
-        if parent_obj and index_prop:
-            setattr(parent_obj, index_prop, 0)
-        return True, None
-    elif action in {"UP", "DOWN"}:
-        if action == "UP" and index > 0:
-            target_idx = index - 1
-        elif action == "DOWN" and index < len(collection) - 1:
-            target_idx = index + 1
-        else:
-            return False, None
-        collection.move(index, target_idx)
-        if parent_obj and index_prop:
-            setattr(parent_obj, index_prop, target_idx)
-        return True, None
-    return False, None
+    handler = _COLLECTION_ACTIONS.get(action)
+    if handler is None:
+        return False, None
+    return handler(collection, index, parent_obj, index_prop)
 
 
 @contextmanager
@@ -317,6 +317,12 @@ class BakeStepRunner:
 
                 stack.callback(cleanup_denoise_scene, denoise_scene)
 
+            # Settings are fixed for the whole step; read them across RNA once.
+            run_meta = {
+                "samples": int(job.setting.sample),
+                "bake_type": str(job.setting.bake_type),
+                "device": str(job.setting.device),
+            }
             total_ch = len(channels)
             for i, c in enumerate(channels):
                 # Update UI status with channel info
@@ -373,12 +379,10 @@ class BakeStepRunner:
                             "meta": {
                                 "res_x": img.size[0],
                                 "res_y": img.size[1],
-                                "samples": int(job.setting.sample),
                                 "duration": total_duration,
                                 "bake_time": bake_duration,
                                 "save_time": save_duration,
-                                "bake_type": str(job.setting.bake_type),
-                                "device": str(job.setting.device),
+                                **run_meta,
                             },
                         }
                     )
@@ -873,13 +877,14 @@ class JobPreparer:
             else (scene.frame_end - start + 1)
         )
 
-        base_idx = setting.bake_motion_startindex
+        base_idx = int(setting.bake_motion_startindex)
+        digits = int(setting.bake_motion_digit)
 
         return [
             {
                 "frame": start + i,
                 "save_idx": base_idx + i,
-                "digits": setting.bake_motion_digit,
+                "digits": digits,
             }
             for i in range(dur)
         ]
@@ -1065,7 +1070,8 @@ class BakePassExecutor:
                 full=is_float,
                 space=target_cs,
                 clear=setting.use_clear_image,
-                basiccolor=setting.color_base,
+                # Snapshot once: set_image reuses it for every pixel buffer and tile
+                basiccolor=tuple(setting.color_base),
                 use_udim=(setting.bake_mode == "UDIM"),
                 udim_tiles=udim_tiles,
                 tile_resolutions=tile_resolutions,
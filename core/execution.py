@@ -10,7 +10,7 @@ import time
 from typing import Any, Dict, List, Optional, Set
 from ..state_manager import BakeStateManager
 from .engine import BakeStepRunner
-from .common import log_error
+from .common import append_error_log, log_error
 from . import compat
 
 logger = logging.getLogger(__name__)
@@ -23,18 +23,29 @@ def add_bake_result_to_ui(
     obj_name: str,
     path: str,
     meta: Optional[Dict[str, Any]] = None,
+    known_images: Optional[Set[int]] = None,
 ) -> Optional[Any]:
     """
     Standardized utility to add a bake result to the scene's UI collection
     and populate metadata (resolution, time, file size).
+
+    known_images: optional set of image pointers already in the collection.
+    Callers adding many results pass one set along so the duplicate check
+    does not rescan the whole collection for every result; it is updated
+    in place.
     """
     results = context.scene.baked_image_results
     # Prevent duplicates
-    if any(r.image == img for r in results):
+    if known_images is not None:
+        if img and img.as_pointer() in known_images:
+            return None
+    elif any(r.image == img for r in results):
         return None
 
     item = results.add()
     item.image = img
+    if known_images is not None and img:
+        known_images.add(img.as_pointer())
     item.channel_type = type_name
     item.object_name = obj_name
     item.filepath = path or ""
@@ -63,6 +74,42 @@ def add_bake_result_to_ui(
             item.file_size = "N/A (Memory)"
     return item
 
+
+_pending_sequence_reloads: List[Any] = []
+_SEQUENCE_RELOAD_INTERVAL = 0.05
+
+
+def _drain_sequence_reloads() -> Optional[float]:
+    """Timer callback: reload one queued sequence image per tick."""
+    if not _pending_sequence_reloads:
+        return None
+    img = _pending_sequence_reloads.pop(0)
+    try:
+        img.reload()
+    except (ReferenceError, RuntimeError) as e:
+        logger.error(f"Failed to reload sequence: {e}")
+    return _SEQUENCE_RELOAD_INTERVAL if _pending_sequence_reloads else None
+
+
+def _queue_sequence_reload(img: bpy.types.Image) -> None:
+    """Reload a sequence image off the finish() path, one decode per tick.
+
+    Background sessions have no event loop to run timers, so reload inline.
+    """
+    if bpy.app.background:
+        try:
+            img.reload()
+        except RuntimeError as e:
+            logger.error(f"Failed to reload sequence: {e}")
+        return
+
+    _pending_sequence_reloads.append(img)
+    if not bpy.app.timers.is_registered(_drain_sequence_reloads):
+        bpy.app.timers.register(
+            _drain_sequence_reloads, first_interval=_SEQUENCE_RELOAD_INTERVAL
+        )
+
+
 class BakeModalOperator:
     """
     Mixin class providing robust modal execution logic, progress tracking,
@@ -79,6 +126,10 @@ class BakeModalOperator:
         self.total_steps: int = 0
         self.sequence_tracking: Dict[Any, Any] = {}
         self.waiting_confirmation: bool = False
+        self._ui_progress_bucket: int = -1
+        self._error_lines: List[str] = []
+        self._result_images: Optional[Set[int]] = None
+        self._result_count: int = 0
 
     def init_modal(self, context: bpy.types.Context, start_idx: int = 0) -> Set[str]:
         """Initialize state and start modal timer."""
@@ -93,10 +144,14 @@ class BakeModalOperator:
         self.total_steps = len(self.bake_queue)
         self.current_step_idx = start_idx
         self.sequence_tracking = {}
+        self._ui_progress_bucket = -1
+        self._error_lines = []
+        self._result_images = None
+        self._result_count = 0
 
         context.scene.is_baking = True
-        context.scene.bake_progress = (self.current_step_idx / max(1, self.total_steps)) * 100.0
-        context.scene.bake_status = "Initializing..."
+        self._update_progress(context)
+        self._update_status(context, "Initializing...")
 
         # HI-04: Append session separator instead of clearing history
         timestamp = time.strftime('%H:%M:%S')
@@ -141,7 +196,8 @@ class BakeModalOperator:
                 self._handle_step_error(context, e)
 
             self.current_step_idx += 1
-            context.scene.bake_progress = (self.current_step_idx / max(1, self.total_steps)) * 100.0
+            if self._update_progress(context):
+                self._tag_progress_redraw(context)
 
         elif event.type == 'ESC':
             self.waiting_confirmation = True
@@ -151,9 +207,38 @@ class BakeModalOperator:
 
         return {'RUNNING_MODAL'}
 
+    def _update_status(self, context, text):
+        """Write bake_status only when the text changed (each write notifies RNA)."""
+        # Compare against the scene value: engine steps write their own
+        # intermediate statuses, so a local cache could go stale.
+        if context.scene.bake_status != text:
+            context.scene.bake_status = text
+
+    def _update_progress(self, context):
+        """Write bake_progress only when it crosses a whole percent."""
+        progress = (self.current_step_idx / max(1, self.total_steps)) * 100.0
+        bucket = int(progress)
+        if bucket != self._ui_progress_bucket:
+            self._ui_progress_bucket = bucket
+            context.scene.bake_progress = progress
+            return True
+        return False
+
+    @staticmethod
+    def _tag_progress_redraw(context):
+        """Redraw only the 3D View areas that host the progress box."""
+        screen = getattr(context, "screen", None)
+        if not screen:
+            return
+        for area in screen.areas:
+            if area.type == "VIEW_3D":
+                area.tag_redraw()
+
     def _process_single_step(self, context, step):
         job, task, f_info = step.job, step.task, step.frame_info
-        context.scene.bake_status = f"[{self.current_step_idx+1}/{self.total_steps}] {task.base_name}"
+        self._update_status(
+            context, f"[{self.current_step_idx+1}/{self.total_steps}] {task.base_name}"
+        )
 
         if f_info:
             context.scene.frame_set(f_info['frame'])
@@ -161,8 +246,12 @@ class BakeModalOperator:
         runner = BakeStepRunner(context)
         results = runner.run(step, self.state_mgr, self.current_step_idx)
 
+        known_images = self._known_result_images(context) if results else None
         for res in results:
-            add_bake_result_to_ui(context, res['image'], res['type'], res['obj'], res['path'], res.get('meta'))
+            add_bake_result_to_ui(
+                context, res['image'], res['type'], res['obj'], res['path'], res.get('meta'),
+                known_images=known_images,
+            )
 
             # Deep GC Pipeline: Free GPU/VRAM buffers immediately after step completion and save.
             img = res['image']
@@ -180,6 +269,21 @@ class BakeModalOperator:
             if f_info and res['path']:
                 self._track_sequence(res['image'], res['path'], f_info['save_idx'])
 
+        if results:
+            self._result_count = len(context.scene.baked_image_results)
+
+    def _known_result_images(self, context):
+        """Image pointers already listed in the results panel.
+
+        Built once per session; rebuilt if the list was edited from the UI
+        while baking (its length no longer matches what this session left).
+        """
+        results = context.scene.baked_image_results
+        if self._result_images is None or len(results) != self._result_count:
+            self._result_images = {r.image.as_pointer() for r in results if r.image}
+            self._result_count = len(results)
+        return self._result_images
+
     def _track_sequence(self, img, path, idx):
         if img not in self.sequence_tracking:
             self.sequence_tracking[img] = {'count': 0, 'first_path': path, 'min_frame': idx}
@@ -191,9 +295,24 @@ class BakeModalOperator:
 
     def _handle_step_error(self, context, e):
         err_msg = f"[Error] Step {self.current_step_idx+1}: {str(e)}"
-        log_error(context, err_msg, self.state_mgr, include_traceback=True)
+        # Tracebacks are only formatted in debug mode; the scene log is
+        # written once in _cleanup_state instead of re-copying it per error.
+        log_error(
+            None,
+            err_msg,
+            self.state_mgr,
+            include_traceback=logger.isEnabledFor(logging.DEBUG),
+        )
+        self._error_lines.append(err_msg)
+
+    def _flush_error_log(self, context):
+        error_lines = getattr(self, "_error_lines", None)
+        if error_lines:
+            append_error_log(context, "\n".join(error_lines))
+            error_lines.clear()
 
     def _cleanup_state(self, context, status="Finished"):
+        self._flush_error_log(context)
         if self.state_mgr:
             self.state_mgr.finish_session(context, status)
         self._remove_timer(context)
@@ -206,13 +325,14 @@ class BakeModalOperator:
     def finish(self, context: bpy.types.Context) -> None:
         """Complete the bake session, save sequence data, and optionally save-and-quit."""
         self._cleanup_state(context, "Finished")
-        # Reload sequences if any
+        # Switch tracked images to sequences now; the disk reload is deferred
         for img, info in self.sequence_tracking.items():
             try:
                 img.source, img.filepath, img.frame_duration = 'SEQUENCE', info['first_path'], info['count']
-                img.reload()
             except RuntimeError as e:
                 logger.error(f"Failed to reload sequence: {e}")
+                continue
+            _queue_sequence_reload(img)
         self.sequence_tracking.clear()
 
         if self.bake_queue and hasattr(self.bake_queue[0].job, 'setting'):
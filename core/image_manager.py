@@ -304,7 +304,7 @@ def _physical_clear_pixels(
         try:
             num_pixels = image.size[0] * image.size[1]
             arr = np.empty((num_pixels, 4), dtype=np.float32)
-            arr[:] = basiccolor
+            arr[:] = np.asarray(basiccolor, dtype=np.float32)
             image.pixels.foreach_set(arr.ravel())
         except (AttributeError, ValueError, MemoryError):
             pass
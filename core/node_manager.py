@@ -7,13 +7,50 @@ links, and providing protection for non-active materials.
 
 import bpy
 import logging
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional
 
 from ..constants import BSDF_COMPATIBILITY_MAP, SOCKET_DEFAULT_TYPE, SYSTEM_NAMES
 from . import compat
 
 logger = logging.getLogger(__name__)
 
+# material name -> name of its active Material Output node
+_OUT_CACHE: Dict[str, str] = {}
+
+
+def find_active_output(material: bpy.types.Material) -> Optional[bpy.types.Node]:
+    """Return the active Material Output node of a material, or None.
+
+    The node name is cached per material and re-validated on every lookup,
+    so repeated bakes of the same material skip the full node scan. A node
+    that was renamed, removed or deactivated simply triggers a rescan.
+    """
+    tree = material.node_tree
+    if not tree:
+        return None
+
+    cached = tree.nodes.get(_OUT_CACHE.get(material.name, ""))
+    if (
+        cached
+        and cached.bl_idname == "ShaderNodeOutputMaterial"
+        and cached.is_active_output
+    ):
+        return cached
+
+    out = next(
+        (
+            n
+            for n in tree.nodes
+            if n.bl_idname == "ShaderNodeOutputMaterial" and n.is_active_output
+        ),
+        None,
+    )
+    if out:
+        _OUT_CACHE[material.name] = out.name
+    else:
+        _OUT_CACHE.pop(material.name, None)
+    return out
+
 
 def bake_node_to_image(
     context: bpy.types.Context,
@@ -52,21 +89,12 @@ def bake_node_to_image(
             with safe_context_override(context, context.active_object):
                 with NodeGraphHandler([material]) as h:
                     tree = material.node_tree
-                    out = next(
-                        (
-                            n
-                            for n in tree.nodes
-                            if n.bl_idname == "ShaderNodeOutputMaterial"
-                            and n.is_active_output
-                        ),
-                        None,
-                    )
+                    out = find_active_output(material)
                     if out:
-                        emi = h._add_node(
-                            material,
-                            "ShaderNodeEmission",
-                            location=(out.location.x - 200, out.location.y),
-                        )
+                        # Reuse the handler's session emission node rather than
+                        # adding a second temporary one to the tree.
+                        emi = h.session_nodes[material]["emi"]
+                        emi.location = (out.location.x - 200, out.location.y)
                         tree.links.new(node.outputs[0], emi.inputs[0])
                         tree.links.new(emi.outputs[0], out.inputs[0])
 
@@ -307,7 +335,7 @@ class NodeGraphHandler:
         """
         for mat in self.materials:
             tree = mat.node_tree
-            out_n = self._find_output(tree)
+            out_n = self._find_output(mat)
             if not out_n or mat not in self.session_nodes:
                 continue
 
@@ -389,13 +417,18 @@ class NodeGraphHandler:
         self.temp_logic_nodes[mat].append(n)
         return n
 
-    def _find_output(self, tree: bpy.types.NodeTree) -> Optional[bpy.types.Node]:
-        """Find the active material output node."""
-        for n in tree.nodes:
-            if n.bl_idname == "ShaderNodeOutputMaterial" and n.is_active_output:
-                return n
+    def _find_output(self, mat: bpy.types.Material) -> Optional[bpy.types.Node]:
+        """Find the active material output node, falling back to any output."""
+        out = find_active_output(mat)
+        if out:
+            return out
         return next(
-            (n for n in tree.nodes if n.bl_idname == "ShaderNodeOutputMaterial"), None
+            (
+                n
+                for n in mat.node_tree.nodes
+                if n.bl_idname == "ShaderNodeOutputMaterial"
+            ),
+            None,
         )
 
     def _find_socket_source(
@@ -27,6 +27,7 @@ from .core.engine import JobPreparer
 from .core.execution import BakeModalOperator
 from . import preset_handler
 from .constants import UI_MESSAGES
+from .property import bump_channel_generation
 from .state_manager import BakeStateManager
 
 logger = logging.getLogger(__name__)
@@ -52,6 +53,34 @@ class _DummyEvent:
     oskey: bool = False
 
 
+def _report_deferred(message: str, level: str = "INFO") -> None:
+    """Report the outcome of work that finished after its operator returned.
+
+    Operators can no longer self.report() at that point, and the timer that
+    calls this has no window in its context, so the popup is shown through a
+    temp_override on the first window. Without any window (background) the
+    message is only logged.
+    """
+    is_error = level == "ERROR"
+    if is_error:
+        logger.error(message)
+    else:
+        logger.info(message)
+
+    wm = getattr(bpy.context, "window_manager", None)
+    if not wm or not wm.windows:
+        return
+    try:
+        with bpy.context.temp_override(window=wm.windows[0]):
+            wm.popup_menu(
+                lambda menu, _context: menu.layout.label(text=message),
+                title="BakeNexus",
+                icon="ERROR" if is_error else "INFO",
+            )
+    except (RuntimeError, TypeError) as e:
+        logger.debug(f"Could not show deferred report popup: {e}")
+
+
 # --- Operators ---
 
 
@@ -893,15 +922,31 @@ class BAKETOOL_OT_SaveSetting(bpy.types.Operator, ExportHelper):
             return {"CANCELLED"}
         job = bj.jobs[bj.job_index]
 
-        data = preset_handler.PropertyIO().to_dict(job)
+        # Background sessions have no event loop for the completion timer.
+        if bpy.app.background:
+            try:
+                preset_handler.save_preset_file(self.filepath, job)
+                self.report({"INFO"}, f"Settings exported to {self.filepath}")
+            except IOError as e:
+                self.report({"ERROR"}, f"Export failed: {e}")
+                return {"CANCELLED"}
+            return {"FINISHED"}
+
+        filepath = self.filepath
+
+        def on_done(error):
+            if error:
+                _report_deferred(f"Export failed: {error}", "ERROR")
+            else:
+                _report_deferred(f"Settings exported to {filepath}")
+
         try:
-            with open(self.filepath, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=4)
-            self.report({"INFO"}, f"Settings exported to {self.filepath}")
-        except IOError as e:
+            preset_handler.save_preset_file_async(filepath, job, on_done)
+        except (TypeError, ValueError) as e:
             self.report({"ERROR"}, f"Export failed: {e}")
             return {"CANCELLED"}
 
+        self.report({"INFO"}, f"Exporting settings to {filepath}...")
         return {"FINISHED"}
 
 
@@ -921,17 +966,39 @@ class BAKETOOL_OT_LoadSetting(bpy.types.Operator, ImportHelper):
         if not bj.jobs:
             bj.jobs.add()
             bj.job_index = 0
-        job = bj.jobs[bj.job_index]
 
-        try:
-            with open(self.filepath, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            preset_handler.PropertyIO().from_dict(job, data)
-            self.report({"INFO"}, f"Settings imported from {self.filepath}")
-        except (IOError, json.JSONDecodeError) as e:
-            self.report({"ERROR"}, f"Import failed: {e}")
-            return {"CANCELLED"}
+        if bpy.app.background:
+            job = bj.jobs[bj.job_index]
+            try:
+                with open(self.filepath, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                preset_handler.PropertyIO(skip_defaults=True).from_dict(job, data)
+                self.report({"INFO"}, f"Settings imported from {self.filepath}")
+            except (IOError, json.JSONDecodeError) as e:
+                self.report({"ERROR"}, f"Import failed: {e}")
+                return {"CANCELLED"}
+            return {"FINISHED"}
+
+        # Parse on the preset worker; RNA writes happen back on the main thread.
+        filepath = self.filepath
+        scene_name = context.scene.name
+        job_index = bj.job_index
 
+        def on_loaded(data, error):
+            if error:
+                _report_deferred(f"Import failed: {error}", "ERROR")
+                return
+            scene = bpy.data.scenes.get(scene_name)
+            jobs = scene.BakeJobs.jobs if scene and hasattr(scene, "BakeJobs") else None
+            if not jobs:
+                _report_deferred("Import failed: target job no longer exists", "ERROR")
+                return
+            job = jobs[min(max(job_index, 0), len(jobs) - 1)]
+            preset_handler.PropertyIO(skip_defaults=True).from_dict(job, data)
+            _report_deferred(f"Settings imported from {filepath}")
+
+        preset_handler.load_preset_file_async(filepath, on_loaded)
+        self.report({"INFO"}, f"Importing settings from {filepath}...")
         return {"FINISHED"}
 
 
@@ -961,6 +1028,9 @@ class BAKETOOL_OT_GenericChannelOperator(bpy.types.Operator):
         if not success:
             self.report({"ERROR"}, msg)
             return {"CANCELLED"}
+        if self.target != "bake_objects":
+            # Add/remove/move fire no RNA update; refresh the source enums.
+            bump_channel_generation()
         return {"FINISHED"}
 
 
@@ -3,6 +3,9 @@ import bpy
 import json
 import logging
 import os
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
 from bpy.app.handlers import persistent
 from .constants import PRESET_DEFAULT_EXCLUDE, PRESET_MIGRATION_MAP, SYSTEM_NAMES
 
@@ -44,6 +47,48 @@ TRANSIENT_ID_PREFIXES = (
     "BT_Compositor_",
 )
 
+# Sentinel returned by PropertyIO._convert_value for properties to omit.
+_SKIP = object()
+
+# Per-RNA-type property layout, filled lazily by _classify_rna().
+_RNA_LAYOUT_CACHE = {}
+RnaLayout = namedtuple(
+    "RnaLayout", ["valid_keys", "collections", "pointers", "readonly"]
+)
+
+
+def _classify_rna(prop_group):
+    """Return the cached property layout for a PropertyGroup's RNA type.
+
+    Property definitions are fixed once a class is registered, so the
+    isinstance() checks only need to run once per type instead of once
+    per key for every loaded item.
+    """
+    bl_rna = prop_group.bl_rna
+    layout = _RNA_LAYOUT_CACHE.get(bl_rna.identifier)
+    if layout is not None:
+        return layout
+
+    valid_keys, collections, pointers, readonly = set(), set(), set(), set()
+    for prop in bl_rna.properties:
+        key = prop.identifier
+        valid_keys.add(key)
+        if isinstance(prop, bpy.types.CollectionProperty):
+            collections.add(key)
+        elif isinstance(prop, bpy.types.PointerProperty) and key != "rna_type":
+            pointers.add(key)
+        elif prop.is_readonly or key == "rna_type":
+            readonly.add(key)
+
+    layout = RnaLayout(
+        frozenset(valid_keys),
+        frozenset(collections),
+        frozenset(pointers),
+        frozenset(readonly),
+    )
+    _RNA_LAYOUT_CACHE[bl_rna.identifier] = layout
+    return layout
+
 
 def _get_id_type_name(value):
     """Return a stable RNA identifier for a Blender ID datablock."""
@@ -108,15 +153,18 @@ class PropertyIO:
     Built-in migration logic for supporting legacy property mapping.
     """
 
-    def __init__(self, exclude_props=None, custom_filter=None):
+    def __init__(self, exclude_props=None, custom_filter=None, skip_defaults=False):
         """
         :param exclude_props: Set of property names to exclude from export.
         :param custom_filter: Custom filtering function (callable), signature func(prop_group, key) -> bool.
+        :param skip_defaults: Omit scalars equal to their RNA default on export, and reset
+            scalars missing from the data to their default on import.
         """
         self.exclude_props = PRESET_DEFAULT_EXCLUDE.copy()
         if exclude_props:
             self.exclude_props.update(exclude_props)
         self.custom_filter = custom_filter
+        self.skip_defaults = skip_defaults
 
         self.stats = {
             'loaded': 0,
@@ -125,13 +173,8 @@ class PropertyIO:
             'error': 0
         }
 
-    def to_dict(self, prop_group):
-        """Convert PropertyGroup to dictionary recursively."""
-        if prop_group is None:
-            return None
-
-        data = {}
-
+    def _iter_props(self, prop_group):
+        """Yield (key, prop_def, value) for every exportable property."""
         for prop in prop_group.bl_rna.properties:
             key = prop.identifier
 
@@ -146,35 +189,112 @@ class PropertyIO:
             except (AttributeError, KeyError):
                 continue
 
+            yield key, prop, value
+
+    def _convert_value(self, prop, value):
+        """Convert a non-collection property value to a JSON-safe object.
+
+        Returns _SKIP when the property should be omitted from the output.
+        """
+        if isinstance(prop, bpy.types.PointerProperty):
+            if value is None:
+                return _SKIP
+
+            if isinstance(value, bpy.types.PropertyGroup):
+                return self.to_dict(value)
+            if isinstance(value, bpy.types.ID):
+                pointer_payload = self._serialize_id_pointer(value)
+                return _SKIP if pointer_payload is None else pointer_payload
+            return _SKIP
+
+        if self.skip_defaults and self._is_default(prop, value):
+            return _SKIP
+
+        if hasattr(value, "to_list"):
+            return value.to_list()
+        if hasattr(value, "to_tuple"):
+            return value.to_tuple()
+        if hasattr(value, "__iter__") and not isinstance(value, (str, bytes)):
+            try:
+                return list(value)
+            except (TypeError, ValueError):
+                return str(value)
+        return value
+
+    @staticmethod
+    def _is_default(prop, value):
+        """Return True if a scalar or array value equals its RNA default."""
+        try:
+            if getattr(prop, "is_array", False):
+                return list(prop.default_array) == list(value)
+            if getattr(prop, "is_enum_flag", False):
+                return set(prop.default_flag) == set(value)
+            return value == prop.default
+        except (AttributeError, TypeError):
+            return False
+
+    def to_dict(self, prop_group):
+        """Convert PropertyGroup to dictionary recursively."""
+        if prop_group is None:
+            return None
+
+        data = {}
+
+        for key, prop, value in self._iter_props(prop_group):
             if isinstance(prop, bpy.types.CollectionProperty):
                 if value and len(value) > 0:
                     data[key] = [self.to_dict(item) for item in value]
+                continue
+
+            converted = self._convert_value(prop, value)
+            if converted is not _SKIP:
+                data[key] = converted
+
+        return data
+
+    def to_stream(self, prop_group, fh):
+        """Write PropertyGroup as JSON directly to an open text file handle.
 
-            elif isinstance(prop, bpy.types.PointerProperty):
-                if value is None:
+        Produces the same document as json.dump(self.to_dict(...)), but
+        collection items and nested groups are written one at a time, so the
+        full nested dict never has to exist in memory.
+        """
+        if prop_group is None:
+            fh.write("null")
+            return
+
+        fh.write("{")
+        first = True
+
+        for key, prop, value in self._iter_props(prop_group):
+            if isinstance(prop, bpy.types.CollectionProperty):
+                if not value or len(value) == 0:
                     continue
+                fh.write(("" if first else ", ") + json.dumps(key) + ": [")
+                for i, item in enumerate(value):
+                    if i:
+                        fh.write(", ")
+                    self.to_stream(item, fh)
+                fh.write("]")
+                first = False
+                continue
 
-                if isinstance(value, bpy.types.PropertyGroup):
-                    data[key] = self.to_dict(value)
-                elif isinstance(value, bpy.types.ID):
-                    pointer_payload = self._serialize_id_pointer(value)
-                    if pointer_payload is not None:
-                        data[key] = pointer_payload
+            if isinstance(prop, bpy.types.PointerProperty) and isinstance(
+                value, bpy.types.PropertyGroup
+            ):
+                fh.write(("" if first else ", ") + json.dumps(key) + ": ")
+                self.to_stream(value, fh)
+                first = False
+                continue
 
-            else:
-                if hasattr(value, "to_list"):
-                    data[key] = value.to_list()
-                elif hasattr(value, "to_tuple"):
-                    data[key] = value.to_tuple()
-                elif hasattr(value, "__iter__") and not isinstance(value, (str, bytes)):
-                    try:
-                        data[key] = list(value)
-                    except (TypeError, ValueError):
-                        data[key] = str(value)
-                else:
-                    data[key] = value
+            converted = self._convert_value(prop, value)
+            if converted is _SKIP:
+                continue
+            fh.write(("" if first else ", ") + json.dumps(key) + ": ")
+            fh.write(json.dumps(converted))
+            first = False
 
-        return data
+        fh.write("}")
 
     def from_dict(self, prop_group, data, clear_collection=True):
         """Write dictionary data to PropertyGroup recursively."""
@@ -182,22 +302,37 @@ class PropertyIO:
             logger.debug(f"FromDict aborted: Input data is not a dictionary (got {type(data).__name__})")
             return
 
-        if not data or not prop_group:
+        # An empty dict is still applied: a sparse export writes an all-default
+        # sub-group as {}, and its scalars must be reset below.
+        if not prop_group:
             return
 
         processed_data = data.copy()
-        for old_key, new_path in PRESET_MIGRATION_MAP.items():
-            if old_key in data:
-                val = processed_data.pop(old_key)
-
-                if isinstance(val, bool):
-                    curr_val = self._get_nested_attr(prop_group, new_path)
-                    if isinstance(curr_val, bool):
-                        val = val or curr_val
-
-                self._set_nested_attr(prop_group, new_path, val)
+        migrated = [
+            (new_path, processed_data.pop(old_key))
+            for old_key, new_path in PRESET_MIGRATION_MAP.items()
+            if old_key in data
+        ]
+
+        layout = _classify_rna(prop_group)
+        # Reset before migrating: legacy keys land on targets that are absent
+        # from the data, and the bool merge below must start from defaults.
+        if self.skip_defaults:
+            self._reset_missing_scalars(prop_group, processed_data, layout)
+
+        for new_path, val in migrated:
+            if isinstance(val, bool):
+                curr_val = self._get_nested_attr(prop_group, new_path)
+                if isinstance(curr_val, bool):
+                    val = val or curr_val
+
+            self._set_nested_attr(prop_group, new_path, val)
+
+        if not layout.collections and not layout.pointers:
+            self._load_scalars(prop_group, processed_data, layout)
+            return
 
-        valid_keys = set(p.identifier for p in prop_group.bl_rna.properties)
+        valid_keys = layout.valid_keys
 
         for key, val in processed_data.items():
             if key not in valid_keys:
@@ -207,10 +342,8 @@ class PropertyIO:
             if key in self.exclude_props:
                 continue
 
-            prop_def = prop_group.bl_rna.properties[key]
-
             try:
-                if isinstance(prop_def, bpy.types.CollectionProperty):
+                if key in layout.collections:
                     target_collection = getattr(prop_group, key)
 
                     if clear_collection:
@@ -223,11 +356,11 @@ class PropertyIO:
                     else:
                         self.stats['error'] += 1
 
-                elif isinstance(prop_def, bpy.types.PointerProperty):
+                elif key in layout.pointers:
                     target_pointer = getattr(prop_group, key)
                     if isinstance(val, dict) and ID_POINTER_MARKER in val:
                         resolved_id = self._resolve_id_pointer(
-                            val[ID_POINTER_MARKER], prop_def
+                            val[ID_POINTER_MARKER], prop_group.bl_rna.properties[key]
                         )
                         if resolved_id is not None:
                             setattr(prop_group, key, resolved_id)
@@ -241,7 +374,7 @@ class PropertyIO:
                             self.stats['error'] += 1
 
                 else:
-                    if prop_def.is_readonly:
+                    if key in layout.readonly:
                         self.stats['skipped_readonly'] += 1
                         continue
 
@@ -252,6 +385,64 @@ class PropertyIO:
                 self.stats['error'] += 1
                 logger.debug(f"FromDict: Failed to load property '{key}' in {type(prop_group).__name__}: {e}")
 
+    def _reset_missing_scalars(self, prop_group, data, layout):
+        """Restore defaults for scalars a sparse preset left out.
+
+        Sparse exports omit default values, so loading onto an existing group
+        must not keep whatever the group held before. Defaults are assigned
+        rather than unset so update callbacks (channel sync, format enums)
+        follow the reset; only values with no assignable default are unset.
+        """
+        skip = layout.collections | layout.pointers | layout.readonly
+        rna_props = prop_group.bl_rna.properties
+        for key in layout.valid_keys:
+            if key in data or key in skip or key in self.exclude_props:
+                continue
+            if self.custom_filter and not self.custom_filter(prop_group, key):
+                continue
+            prop = rna_props[key]
+            try:
+                if self._is_default(prop, getattr(prop_group, key)):
+                    continue
+                setattr(prop_group, key, self._default_value(prop))
+            except (AttributeError, TypeError, ValueError):
+                try:
+                    prop_group.property_unset(key)
+                except (AttributeError, TypeError) as e:
+                    logger.debug(f"FromDict: Failed to reset '{key}' in {type(prop_group).__name__}: {e}")
+
+    @staticmethod
+    def _default_value(prop):
+        """Return the RNA default of a scalar property in assignable form."""
+        if getattr(prop, "is_array", False):
+            return tuple(prop.default_array)
+        if getattr(prop, "is_enum_flag", False):
+            return set(prop.default_flag)
+        return prop.default
+
+    def _load_scalars(self, prop_group, data, layout):
+        """Fast path for leaf PropertyGroups that only hold scalar properties."""
+        valid_keys = layout.valid_keys
+        readonly = layout.readonly
+        exclude = self.exclude_props
+        stats = self.stats
+
+        for key, val in data.items():
+            if key not in valid_keys:
+                stats['skipped_match'] += 1
+                continue
+            if key in exclude:
+                continue
+            if key in readonly:
+                stats['skipped_readonly'] += 1
+                continue
+            try:
+                setattr(prop_group, key, val)
+                stats['loaded'] += 1
+            except (AttributeError, TypeError, ValueError) as e:
+                stats['error'] += 1
+                logger.debug(f"FromDict: Failed to load property '{key}' in {type(prop_group).__name__}: {e}")
+
     def _serialize_id_pointer(self, value):
         """Serialize Blender ID pointers by stable type/name reference."""
         if _is_transient_id(value):
@@ -331,6 +522,122 @@ class PropertyIO:
                 f"Errors: {self.stats['error']}")
 
 
+PRESET_WRITE_BUFFER = 1 << 20
+PRESET_IO_POLL_INTERVAL = 0.05
+
+# Single worker so preset writes to the same path never interleave.
+_preset_io_pool = None
+
+
+def _get_preset_io_pool():
+    global _preset_io_pool
+    if _preset_io_pool is None:
+        _preset_io_pool = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="BakeNexusPresetIO"
+        )
+    return _preset_io_pool
+
+
+def shutdown_preset_io_pool():
+    """Finish pending preset writes and release the worker thread."""
+    global _preset_io_pool
+    if _preset_io_pool is not None:
+        _preset_io_pool.shutdown(wait=True)
+        _preset_io_pool = None
+
+
+def _write_file_atomic(filepath, write):
+    """Run write(f) against a sibling temp file, fsync once, then os.replace.
+
+    :raises OSError: If the temp file cannot be written or moved into place.
+    :raises TypeError: If a property value is not JSON serializable.
+    """
+    tmp_path = f"{filepath}.tmp"
+    try:
+        with open(
+            tmp_path, "w", encoding="utf-8", buffering=PRESET_WRITE_BUFFER
+        ) as f:
+            write(f)
+            f.flush()
+            try:
+                os.fsync(f.fileno())
+            except (OSError, AttributeError, NotImplementedError):
+                pass
+        os.replace(tmp_path, filepath)
+    except (OSError, TypeError, ValueError):
+        if os.path.exists(tmp_path):
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+        raise
+
+
+def _read_json_file(filepath):
+    with open(filepath, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _call_when_done(future, callback):
+    """Poll a worker future from a bpy timer and run callback on the main thread."""
+
+    def poll():
+        if not future.done():
+            return PRESET_IO_POLL_INTERVAL
+        callback(future)
+        return None
+
+    bpy.app.timers.register(poll, first_interval=PRESET_IO_POLL_INTERVAL)
+
+
+def save_preset_file(filepath, prop_group, io=None):
+    """Atomically write a PropertyGroup preset as JSON.
+
+    The document is streamed into a sibling temp file through one large
+    buffer, fsynced once, then swapped in with os.replace so a crash never
+    leaves a half-written preset behind.
+
+    :raises OSError: If the temp file cannot be written or moved into place.
+    :raises TypeError: If a property value is not JSON serializable.
+    """
+    io = io or PropertyIO(skip_defaults=True)
+    _write_file_atomic(filepath, lambda f: io.to_stream(prop_group, f))
+
+
+def save_preset_file_async(filepath, prop_group, on_done, io=None):
+    """Serialize on the main thread, then write to disk on the preset worker.
+
+    RNA may only be read from the main thread, so serialization stays here
+    and only the disk write (open/write/fsync/replace) runs on the worker.
+    The streamed chunks are handed over as a list and written with
+    writelines, so the document is held once rather than joined into a
+    second full copy. on_done(error) runs on the main thread; error is None
+    on success.
+    """
+    io = io or PropertyIO(skip_defaults=True)
+    chunks = []
+    io.to_stream(prop_group, SimpleNamespace(write=chunks.append))
+
+    future = _get_preset_io_pool().submit(
+        _write_file_atomic, filepath, lambda f: f.writelines(chunks)
+    )
+    _call_when_done(future, lambda fut: on_done(fut.exception()))
+
+
+def load_preset_file_async(filepath, on_loaded):
+    """Read and parse a preset on the worker; on_loaded(data, error) runs on the main thread.
+
+    Applying the data (from_dict) writes RNA, so it must happen in on_loaded.
+    """
+
+    def finish(future):
+        error = future.exception()
+        on_loaded(None if error else future.result(), error)
+
+    future = _get_preset_io_pool().submit(_read_json_file, filepath)
+    _call_when_done(future, finish)
+
+
 def load_preset_into_jobs_manager(jobs_manager, data, clear_existing=True):
     """Load either a BakeJobs snapshot or a single BakeJob preset.
 
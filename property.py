@@ -2,7 +2,10 @@
 
 import bpy
 from bpy import props
+from bpy.app.handlers import persistent
 import os
+import sys
+from collections import OrderedDict, deque
 from pathlib import Path
 from .constants import (
     BAKE_TYPES,
@@ -20,6 +23,7 @@ from .constants import (
     NAMING_MODES,
     CUSTOM_CHANNEL_SEP,
     FORMAT_SETTINGS,
+    UNKNOWN_FORMAT_SETTINGS,
 )
 
 from .core.common import reset_channels_logic
@@ -35,10 +39,6 @@ _CANONICAL_DEPTH_KEYS = {"8", "10", "12", "16", "32"}
 _CANONICAL_MODE_KEYS = {"RGBA", "RGB", "BW"}
 
 
-def _as_key_set(values):
-    return set(values) if values else set()
-
-
 def _canonical_depth(value):
     key = str(value) if value is not None else ""
     return _LEGACY_DEPTH_MAP.get(key, key)
@@ -71,6 +71,17 @@ def _pick_first_allowed(valid_keys, ordered_items, preferred):
     return None
 
 
+def _active_item(collection, index):
+    """Return collection[index], or None when the index is out of range.
+
+    Reads the collection and index once each, instead of the repeated
+    len()/bounds/lookup round-trips UI code would otherwise make.
+    """
+    if 0 <= index < len(collection):
+        return collection[index]
+    return None
+
+
 def _find_item_by_identifier(items, identifier):
     for item in items:
         if item[0] == identifier:
@@ -78,166 +89,299 @@ def _find_item_by_identifier(items, identifier):
     return None
 
 
+# Dynamic enum item lists handed to Blender. Blender keeps pointing at the
+# strings of the last returned list, so identical inputs must return the
+# very same list object instead of a fresh copy on every redraw.
+_NO_SOURCE_ITEMS = (("NONE", "None", "No enabled channels available", "NONE", 0),)
+# (job pointer, channel generation) -> _SourceItems, least recently used first
+_SOURCE_ITEMS_CACHE = OrderedDict()
+_SOURCE_ITEMS_CACHE_LIMIT = 64
+# Entries evicted or cleared recently; Blender may still hold their strings
+# until the next redraw re-queries the enum.
+_SOURCE_ITEMS_RETIRED = deque(maxlen=_SOURCE_ITEMS_CACHE_LIMIT)
+_FORMAT_ITEMS_CACHE = {}
+_SOURCE_DESC_CACHE = {}
+_CUSTOM_LANES = ("r", "g", "b", "a", "bw")
+
+# Bumped whenever a channel's id, name or enabled state is written, and when
+# the job or custom channel lists are edited through the list operators.
+_channel_generation = 0
+
+
+class _SourceItems:
+    """Source items of one job at one channel generation.
+
+    variants maps the custom channel being edited (None for none) to its
+    items, which leave that channel out to prevent self-reference.
+    """
+
+    __slots__ = ("counts", "owners", "variants")
+
+    def __init__(self, counts, owners, items):
+        self.counts = counts
+        self.owners = owners
+        self.variants = {None: items}
+
+
+def clear_enum_items_cache():
+    """Drop memoized channel source items (called when channels are rebuilt)."""
+    _SOURCE_ITEMS_RETIRED.extend(_SOURCE_ITEMS_CACHE.values())
+    _SOURCE_ITEMS_CACHE.clear()
+
+
+class ClearEnumCacheHandler:
+    """Drop pointer-keyed caches when RNA data is replaced under them.
+
+    Undo, redo and file load restore channels without firing update
+    callbacks, and may hand out the pointers of old jobs to new ones.
+    """
+
+    _HANDLER_LISTS = ("load_post", "undo_post", "redo_post")
+
+    @staticmethod
+    @persistent
+    def clear_caches(*_args):
+        clear_enum_items_cache()
+        _CHANNEL_SYNC_STATE.clear()
+
+    @classmethod
+    def register(cls):
+        for name in cls._HANDLER_LISTS:
+            handlers = getattr(bpy.app.handlers, name)
+            if cls.clear_caches not in handlers:
+                handlers.append(cls.clear_caches)
+
+    @classmethod
+    def unregister(cls):
+        for name in cls._HANDLER_LISTS:
+            handlers = getattr(bpy.app.handlers, name)
+            if cls.clear_caches in handlers:
+                handlers.remove(cls.clear_caches)
+
+
+def bump_channel_generation():
+    """Invalidate memoized channel source items after a channel list edit."""
+    global _channel_generation
+    _channel_generation += 1
+
+
+def _source_description(name, custom):
+    """Return the shared tooltip string for a channel source item."""
+    key = (name, custom)
+    desc = _SOURCE_DESC_CACHE.get(key)
+    if desc is None:
+        desc = f"Use {name} (Custom) as source" if custom else f"Use {name} result as source"
+        _SOURCE_DESC_CACHE[key] = desc
+    return desc
+
+
+def _bump_channel_generation(self, context):
+    """Invalidate memoized channel source items when a channel changes."""
+    bump_channel_generation()
+
+
+def _build_source_items(job, setting, counts):
+    """Collect every enabled and custom channel of a job as enum items."""
+    # RNA returns a new str on every read; intern them so all cached item
+    # lists share one object per identifier and label.
+    intern = sys.intern
+    items = [
+        (intern(c.id), intern(c.name), _source_description(c.name, False), "NONE", i)
+        for i, c in enumerate(setting.channels)
+        if c.enabled
+    ]
+
+    owners = {}
+    base_len = len(items)
+    for i, c in enumerate(job.custom_bake_channels):
+        name = intern(c.name)
+        items.append(
+            (intern(f"BT_CUSTOM_{name}"), name, _source_description(name, True), "NONE", base_len + i)
+        )
+        for lane in _CUSTOM_LANES:
+            owners[getattr(c, f"{lane}_settings").as_pointer()] = name
+
+    return _SourceItems(counts, owners, tuple(items) if items else _NO_SOURCE_ITEMS)
+
+
 def get_channel_source_items(self, context):
     """Safely retrieve available channels for custom source selection."""
-    if not context or not getattr(context, "scene", None):
-        return [("NONE", "None", "No enabled channels available", "NONE", 0)]
-
-    scene = context.scene
-    if not hasattr(scene, "BakeJobs") or not scene.BakeJobs.jobs:
-        return [("NONE", "None", "No enabled channels available", "NONE", 0)]
-
-    bj = scene.BakeJobs
-    job_index = getattr(bj, "job_index", 0)
-
-    if job_index < 0 or job_index >= len(bj.jobs):
-        return [("NONE", "None", "No enabled channels available", "NONE", 0)]
-
-    try:
-        job = bj.jobs[job_index]
-        setting = job.setting
-
-        items = []
-        for i, c in enumerate(setting.channels):
-            if c.enabled:
-                items.append(
-                    (c.id, c.name, f"Use {c.name} result as source", "NONE", i)
-                )
-
-        # Prevent self-reference
-        current_custom_name = None
-        for chan in job.custom_bake_channels:
-            if any(getattr(chan, f"{s}_settings") == self for s in ["r", "g", "b", "a", "bw"]):
-                current_custom_name = chan.name
-                break
-
-        base_len = len(items)
-        for i, c in enumerate(job.custom_bake_channels):
-            # Self-reference filter
-            if current_custom_name and c.name == current_custom_name:
-                continue
-
-            identifier = f"BT_CUSTOM_{c.name}"
-            items.append(
-                (
-                    identifier,
-                    c.name,
-                    f"Use {c.name} (Custom) as source",
-                    "NONE",
-                    base_len + i,
-                )
+    scene = getattr(context, "scene", None) if context else None
+    if not scene:
+        return _NO_SOURCE_ITEMS
+
+    # Explicit guards rather than a try block: this runs on every redraw.
+    # Each RNA hop is resolved once and bound to a local.
+    bj = getattr(scene, "BakeJobs", None)
+    if bj is None:
+        return _NO_SOURCE_ITEMS
+    jobs = bj.jobs
+    job_index = bj.job_index
+    if job_index < 0 or job_index >= len(jobs):
+        return _NO_SOURCE_ITEMS
+
+    job = jobs[job_index]
+    setting = job.setting
+
+    # One entry per job, shared by every row that draws a source enum.
+    # The counts catch collection edits made outside the list operators
+    # (scripts, preset loads), which fire no update callback.
+    key = (job.as_pointer(), _channel_generation)
+    counts = (len(setting.channels), len(job.custom_bake_channels))
+    entry = _SOURCE_ITEMS_CACHE.get(key)
+    if entry is not None and entry.counts == counts:
+        _SOURCE_ITEMS_CACHE.move_to_end(key)
+    else:
+        if entry is not None:
+            _SOURCE_ITEMS_RETIRED.append(entry)
+        entry = _build_source_items(job, setting, counts)
+        _SOURCE_ITEMS_CACHE[key] = entry
+        while len(_SOURCE_ITEMS_CACHE) > _SOURCE_ITEMS_CACHE_LIMIT:
+            _SOURCE_ITEMS_RETIRED.append(_SOURCE_ITEMS_CACHE.popitem(last=False)[1])
+
+    # Self-reference filter: a custom channel cannot source itself.
+    owner = entry.owners.get(self.as_pointer()) if isinstance(self, bpy.types.bpy_struct) else None
+    items = entry.variants.get(owner)
+    if items is None:
+        own_id = f"BT_CUSTOM_{owner}"
+        items = tuple(it for it in entry.variants[None] if it[0] != own_id) or _NO_SOURCE_ITEMS
+        entry.variants[owner] = items
+    return items
+
+
+def _channel_source_enum(name):
+    """EnumProperty picking a baked or custom channel as a source."""
+    return props.EnumProperty(items=get_channel_source_items, name=name)
+
+
+def _build_format_table(canonical_items, key):
+    """Prebuild the filtered enum items of every known image format."""
+    table = {}
+    for fmt, cfg in FORMAT_SETTINGS.items():
+        valid_keys = cfg.get(key)
+        if valid_keys:
+            table[fmt] = tuple(
+                _build_enum_item(item, i)
+                for i, item in enumerate(canonical_items)
+                if item[0] in valid_keys
             )
+    return table
 
-        return (
-            items
-            if items
-            else [("NONE", "None", "No enabled channels available", "NONE", 0)]
-        )
-    except (AttributeError, RuntimeError, TypeError) as e:
-        logger.debug(f"Error getting channel sources: {e}")
-        return [("NONE", "None", "No enabled channels available", "NONE", 0)]
-
-
-def get_valid_depths(self, context):
-    """Filter color depths based on current image format technical constraints."""
-    try:
-        canonical_items = _canonical_depth_items()
-        default_items = [
-            _build_enum_item(item, i) for i, item in enumerate(canonical_items)
-        ]
-
-        if not context or not hasattr(context, "scene"):
-            return default_items
-
-        fmt = getattr(self, "external_save_format", "PNG")
-        valid_keys = _as_key_set(FORMAT_SETTINGS.get(fmt, {}).get("depths", []))
-        raw_current = str(self.get("color_depth", ""))
-        current = _canonical_depth(raw_current)
-
-        if not valid_keys:
-            return default_items
-
-        filtered = [
-            _build_enum_item(item, i)
-            for i, item in enumerate(canonical_items)
-            if item[0] in valid_keys
-        ]
-
-        if current and current not in {item[0] for item in filtered}:
-            for item in canonical_items:
-                if item[0] == current:
-                    filtered.append(_build_enum_item(item, len(filtered)))
-                    break
-        if raw_current in _LEGACY_DEPTH_MAP:
-            legacy_item = _find_item_by_identifier(COLOR_DEPTHS, raw_current)
-            if legacy_item:
-                filtered.append(_build_enum_item(legacy_item, len(filtered)))
-
-        return filtered if filtered else default_items
-    except (AttributeError, RuntimeError, TypeError) as e:
-        logger.error(f"Error in get_valid_depths: {e}")
-        return [("8", "8", "Fallback 8-bit", "NONE", 0)]
-
-
-def get_valid_modes(self, context):
-    """Filter color modes based on current image format technical constraints."""
-    try:
-        canonical_items = _canonical_mode_items()
-        default_items = [
-            _build_enum_item(item, i) for i, item in enumerate(canonical_items)
-        ]
-        if not context or not hasattr(context, "scene"):
-            return default_items
-
-        fmt = getattr(self, "external_save_format", "PNG")
-        valid_keys = _as_key_set(FORMAT_SETTINGS.get(fmt, {}).get("modes", []))
-        raw_current = str(self.get("color_mode", ""))
-        current = _canonical_mode(raw_current)
-
-        if not valid_keys:
-            return default_items
-
-        filtered = [
-            _build_enum_item(item, i)
-            for i, item in enumerate(canonical_items)
-            if item[0] in valid_keys
-        ]
-
-        if current and current not in {item[0] for item in filtered}:
-            for item in canonical_items:
-                if item[0] == current:
-                    filtered.append(_build_enum_item(item, len(filtered)))
-                    break
-        if raw_current in _LEGACY_MODE_MAP:
-            legacy_item = _find_item_by_identifier(COLOR_MODES, raw_current)
+
+_CANONICAL_DEPTHS = _canonical_depth_items()
+_CANONICAL_MODES = _canonical_mode_items()
+_DEFAULT_DEPTH_ITEMS = tuple(
+    _build_enum_item(item, i) for i, item in enumerate(_CANONICAL_DEPTHS)
+)
+_DEFAULT_MODE_ITEMS = tuple(
+    _build_enum_item(item, i) for i, item in enumerate(_CANONICAL_MODES)
+)
+_DEPTHS_BY_FMT = _build_format_table(_CANONICAL_DEPTHS, "depths")
+_MODES_BY_FMT = _build_format_table(_CANONICAL_MODES, "modes")
+
+
+def _with_current_item(cache_key, base, raw_current, current, canonical_items, all_items, legacy_map, default_items):
+    """Return the prebuilt items, extended with an off-format or legacy current value."""
+    cached = _FORMAT_ITEMS_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
+    items = base
+    needs_current = current and not any(item[0] == current for item in base)
+    if needs_current or raw_current in legacy_map:
+        items = list(base)
+        if needs_current:
+            item = _find_item_by_identifier(canonical_items, current)
+            if item:
+                items.append(_build_enum_item(item, len(items)))
+        if raw_current in legacy_map:
+            legacy_item = _find_item_by_identifier(all_items, raw_current)
             if legacy_item:
-                filtered.append(_build_enum_item(legacy_item, len(filtered)))
+                items.append(_build_enum_item(legacy_item, len(items)))
+        items = tuple(items)
+
+    _FORMAT_ITEMS_CACHE[cache_key] = items if items else default_items
+    return _FORMAT_ITEMS_CACHE[cache_key]
 
-        return filtered if filtered else default_items
-    except (AttributeError, RuntimeError, TypeError) as e:
-        logger.error(f"Error in get_valid_modes: {e}")
-        return [("RGB", "RGB", "Fallback RGB", "NONE", 0)]
+
+def _make_format_items_callback(
+    value_attr, table, canonical_items, all_items, legacy_map, canonicalize, default_items, fallback
+):
+    """Build an EnumProperty items callback for a format-dependent enum.
+
+    Everything that differs between the depth and mode enums is bound here
+    once, so the callback itself is a table lookup on the current format.
+    """
+    def callback(self, context):
+        try:
+            if not context or not hasattr(context, "scene"):
+                return default_items
+
+            fmt = self.external_save_format
+            base = table.get(fmt)
+            if base is None:
+                return default_items
+
+            raw_current = str(self.get(value_attr, ""))
+            return _with_current_item(
+                (value_attr, fmt, raw_current),
+                base,
+                raw_current,
+                canonicalize(raw_current),
+                canonical_items,
+                all_items,
+                legacy_map,
+                default_items,
+            )
+        except (AttributeError, RuntimeError, TypeError) as e:
+            logger.error(f"Error getting {value_attr} items: {e}")
+            return fallback
+
+    return callback
+
+
+# Filter color depths / modes based on the image format's technical constraints.
+get_valid_depths = _make_format_items_callback(
+    value_attr="color_depth",
+    table=_DEPTHS_BY_FMT,
+    canonical_items=_CANONICAL_DEPTHS,
+    all_items=COLOR_DEPTHS,
+    legacy_map=_LEGACY_DEPTH_MAP,
+    canonicalize=_canonical_depth,
+    default_items=_DEFAULT_DEPTH_ITEMS,
+    fallback=(("8", "8", "Fallback 8-bit", "NONE", 0),),
+)
+get_valid_modes = _make_format_items_callback(
+    value_attr="color_mode",
+    table=_MODES_BY_FMT,
+    canonical_items=_CANONICAL_MODES,
+    all_items=COLOR_MODES,
+    legacy_map=_LEGACY_MODE_MAP,
+    canonicalize=_canonical_mode,
+    default_items=_DEFAULT_MODE_ITEMS,
+    fallback=(("RGB", "RGB", "Fallback RGB", "NONE", 0),),
+)
 
 
 def update_format_dependent_enums(self, context):
     """Keep dynamic format-dependent enums in a valid state."""
-    fmt = getattr(self, "external_save_format", "PNG")
-    fmt_cfg = FORMAT_SETTINGS.get(fmt, {})
-    valid_depths = _as_key_set(fmt_cfg.get("depths", []))
-    valid_modes = _as_key_set(fmt_cfg.get("modes", []))
+    fmt = self.external_save_format
+    fmt_cfg = FORMAT_SETTINGS.get(fmt, UNKNOWN_FORMAT_SETTINGS)
+    valid_depths = fmt_cfg["depths"]
+    valid_modes = fmt_cfg["modes"]
 
     current_depth = _canonical_depth(self.get("color_depth", "8"))
     current_mode = _canonical_mode(self.get("color_mode", "RGBA"))
 
     if valid_depths and current_depth not in valid_depths:
-        next_depth = _pick_first_allowed(valid_depths, _canonical_depth_items(), "8")
+        next_depth = _pick_first_allowed(valid_depths, _CANONICAL_DEPTHS, "8")
         if next_depth:
             self.color_depth = next_depth
     elif current_depth:
         self.color_depth = current_depth
 
     if valid_modes and current_mode not in valid_modes:
-        next_mode = _pick_first_allowed(valid_modes, _canonical_mode_items(), "RGB")
+        next_mode = _pick_first_allowed(valid_modes, _CANONICAL_MODES, "RGB")
         if next_mode:
             self.color_mode = next_mode
     elif current_mode:
@@ -246,14 +390,44 @@ def update_format_dependent_enums(self, context):
 
 def update_debug_mode(self, context):
     """Update global logger level based on debug setting."""
-    logging.getLogger(__package__).setLevel(
-        logging.DEBUG if self.debug_mode else logging.INFO
+    pkg_logger = logging.getLogger(__package__)
+    level = logging.DEBUG if self.debug_mode else logging.INFO
+    # setLevel flushes the isEnabledFor cache of every logger in the process
+    if pkg_logger.level != level:
+        pkg_logger.setLevel(level)
+
+
+# BakeJobSetting pointer -> channel-set inputs at its last sync
+# Cleared on undo/redo/load; the bound covers jobs deleted within a session.
+_CHANNEL_SYNC_STATE = {}
+_CHANNEL_SYNC_STATE_LIMIT = 64
+
+
+def _channel_sync_key(setting):
+    return (
+        setting.bake_type,
+        setting.use_light_map,
+        setting.use_mesh_map,
+        setting.use_extension_map,
+        len(setting.channels),
     )
 
 
 def update_channels(self, context):
-    """Trigger channel sync when map categories are toggled."""
+    """Trigger channel sync when map categories are toggled.
+
+    RNA fires this on every write, even when the value did not change (preset
+    loads and scripts re-assign all four toggles). The sync is skipped when
+    the inputs that decide the channel set match the last sync.
+    """
+    ptr = self.as_pointer()
+    if _CHANNEL_SYNC_STATE.get(ptr) == _channel_sync_key(self):
+        return
     reset_channels_logic(self)
+    if len(_CHANNEL_SYNC_STATE) >= _CHANNEL_SYNC_STATE_LIMIT:
+        _CHANNEL_SYNC_STATE.clear()
+    _CHANNEL_SYNC_STATE[ptr] = _channel_sync_key(self)
+    clear_enum_items_cache()
 
 
 def update_preview(self, context):
@@ -362,7 +536,7 @@ class BakeObject(bpy.types.PropertyGroup):
 
 class BakeChannelSource(bpy.types.PropertyGroup):
     use_map: props.BoolProperty(name="Use Map", default=False)
-    source: props.EnumProperty(items=get_channel_source_items, name="Source")
+    source: _channel_source_enum("Source")
     invert: props.BoolProperty(name="Invert", default=False)
     sep_col: props.BoolProperty(name="Separate", default=False)
     col_chan: props.EnumProperty(items=CUSTOM_CHANNEL_SEP, name="Channel")
@@ -371,9 +545,11 @@ class BakeChannelSource(bpy.types.PropertyGroup):
 
 class BakeChannel(bpy.types.PropertyGroup):
     valid_for_mode: props.BoolProperty(default=True)
-    name: props.StringProperty(name="Channel Name")
-    id: props.StringProperty(name="Channel ID")
-    enabled: props.BoolProperty(name="Enabled", default=False)
+    name: props.StringProperty(name="Channel Name", update=_bump_channel_generation)
+    id: props.StringProperty(name="Channel ID", update=_bump_channel_generation)
+    enabled: props.BoolProperty(
+        name="Enabled", default=False, update=_bump_channel_generation
+    )
     prefix: props.StringProperty(name="Prefix")
     suffix: props.StringProperty(name="Suffix")
 
@@ -398,7 +574,9 @@ class BakeChannel(bpy.types.PropertyGroup):
 
 
 class CustomBakeChannel(bpy.types.PropertyGroup):
-    name: props.StringProperty(name="Name", default="Custom Channel")
+    name: props.StringProperty(
+        name="Name", default="Custom Channel", update=_bump_channel_generation
+    )
     color_space: props.EnumProperty(
         items=COLOR_SPACES, name="Color Space", default="NONCOL"
     )
@@ -465,10 +643,10 @@ class BakeJobSetting(bpy.types.PropertyGroup):
     # Auto-Cage 2.0
     auto_cage_mode: props.EnumProperty(
         name="Cage Mode",
-        items=[
+        items=(
             ("UNIFORM", "Uniform", "Standard normal offset"),
             ("PROXIMITY", "Proximity", "Ray-cast based smart offset"),
-        ],
+        ),
         default="UNIFORM",
     )
     auto_cage_margin: props.FloatProperty(name="Safety Margin", default=0.1, min=0.0)
@@ -519,7 +697,7 @@ class BakeJobSetting(bpy.types.PropertyGroup):
 
     export_model: props.BoolProperty(name="Export Model", default=False)
     export_format: props.EnumProperty(
-        items=[("FBX", "FBX", "", 1), ("GLB", "GLB", "", 2), ("USD", "USD", "", 3)],
+        items=(("FBX", "FBX", "", 1), ("GLB", "GLB", "", 2), ("USD", "USD", "", 3)),
         default="FBX",
     )
     export_textures_with_model: props.BoolProperty(
@@ -542,10 +720,10 @@ class BakeJobSetting(bpy.types.PropertyGroup):
 
     # Channel Packing (ORM etc)
     use_packing: props.BoolProperty(name="Auto Pack Channels", default=False)
-    pack_r: props.EnumProperty(items=get_channel_source_items, name="Red (R)")
-    pack_g: props.EnumProperty(items=get_channel_source_items, name="Green (G)")
-    pack_b: props.EnumProperty(items=get_channel_source_items, name="Blue (B)")
-    pack_a: props.EnumProperty(items=get_channel_source_items, name="Alpha (A)")
+    pack_r: _channel_source_enum("Red (R)")
+    pack_g: _channel_source_enum("Green (G)")
+    pack_b: _channel_source_enum("Blue (B)")
+    pack_a: _channel_source_enum("Alpha (A)")
     pack_suffix: props.StringProperty(name="Suffix", default="_ORM")
 
     # Roadmap 1.1: Interactive Preview
@@ -587,11 +765,11 @@ class BakeJobSetting(bpy.types.PropertyGroup):
 
     udim_mode: props.EnumProperty(
         name="UDIM Mode",
-        items=[
+        items=(
             ("DETECT", "Use Existing UVs", ""),
             ("REPACK", "Auto Repack", ""),
             ("CUSTOM", "Custom List", ""),
-        ],
+        ),
         default="DETECT",
     )
 
@@ -611,6 +789,11 @@ class BakeJobSetting(bpy.types.PropertyGroup):
         description="Target texel density in px/unit",
     )
 
+    @property
+    def active_channel(self):
+        """The channel selected in the channel list, or None."""
+        return _active_item(self.channels, self.active_channel_index)
+
 
 class BakeJob(bpy.types.PropertyGroup):
     name: props.StringProperty(name="Job Name", default="New Job")
@@ -619,6 +802,11 @@ class BakeJob(bpy.types.PropertyGroup):
     custom_bake_channels: props.CollectionProperty(type=CustomBakeChannel)
     custom_bake_channels_index: props.IntProperty(name="Index", default=0)
 
+    @property
+    def active_custom_channel(self):
+        """The custom channel selected in its list, or None."""
+        return _active_item(self.custom_bake_channels, self.custom_bake_channels_index)
+
 
 # NOTE: Image format props intentionally duplicated from BakeJobSetting.
 # Blender PropertyGroup does not support inheritance-based reuse,
@@ -72,7 +72,7 @@ class SuiteCodeReviewFixes(unittest.TestCase):
 
         result = get_channel_source_items(FakeSelf(), None)
 
-        self.assertIsInstance(result, list)
+        self.assertIsInstance(result, tuple)
         self.assertEqual(len(result), 1)
         self.assertEqual(result[0][0], "NONE")
 
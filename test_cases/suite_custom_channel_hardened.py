@@ -147,5 +147,74 @@ class SuiteCustomChannelHardened(unittest.TestCase):
         self.assertIn("Channel_A", item_names_b)
         self.assertNotIn("Channel_B", item_names_b, "Channel_B should be filtered out from its own source list")
 
+    def test_channel_source_items_are_memoized(self):
+        """Unchanged channel state must return the same list object to Blender."""
+        from ..property import get_channel_source_items
+
+        job = JobBuilder("MemoJob").build()
+        c1 = job.custom_bake_channels.add()
+        c1.name = "Channel_A"
+
+        first = get_channel_source_items(c1.bw_settings, bpy.context)
+        self.assertIs(get_channel_source_items(c1.bw_settings, bpy.context), first)
+
+        c2 = job.custom_bake_channels.add()
+        c2.name = "Channel_B"
+        refreshed = get_channel_source_items(c1.bw_settings, bpy.context)
+        self.assertIsNot(refreshed, first)
+        self.assertIn("Channel_B", [it[1] for it in refreshed])
+
+        c2.name = "Channel_C"
+        renamed = get_channel_source_items(c1.bw_settings, bpy.context)
+        self.assertIsNot(renamed, refreshed)
+        self.assertIn("Channel_C", [it[1] for it in renamed])
+
+    def test_channel_source_cache_is_per_job_and_tracks_reorder(self):
+        """Many rows share one cache entry; reordering custom channels refreshes the order."""
+        from .. import property as prop_module
+        from ..property import get_channel_source_items
+
+        job = JobBuilder("RowsJob").build()
+        for i in range(prop_module._SOURCE_ITEMS_CACHE_LIMIT + 6):
+            job.custom_bake_channels.add().name = f"Row_{i}"
+        prop_module.clear_enum_items_cache()
+
+        lanes = [c.r_settings for c in job.custom_bake_channels]
+        first = [get_channel_source_items(lane, bpy.context) for lane in lanes]
+        self.assertEqual(len(prop_module._SOURCE_ITEMS_CACHE), 1)
+        for lane, items in zip(lanes, first):
+            self.assertIs(get_channel_source_items(lane, bpy.context), items)
+        for c, items in zip(job.custom_bake_channels, first):
+            self.assertNotIn(f"BT_CUSTOM_{c.name}", [it[0] for it in items])
+
+        def custom_order():
+            items = get_channel_source_items(job.custom_bake_channels[0].r_settings, bpy.context)
+            return [it[1] for it in items if it[0].startswith("BT_CUSTOM_")]
+
+        self.assertEqual(custom_order()[:2], ["Row_1", "Row_2"])
+        job.custom_bake_channels_index = 2
+        bpy.ops.baketool.generic_channel_op(target="job_custom_channel", action_type="UP")
+        self.assertEqual(custom_order()[:2], ["Row_2", "Row_1"])
+
+    def test_undo_and_load_handlers_clear_source_cache(self):
+        """Undo, redo and file load drop cached source items keyed by stale pointers."""
+        from .. import property as prop_module
+        from ..property import get_channel_source_items
+
+        handler = prop_module.ClearEnumCacheHandler.clear_caches
+        for name in ("load_post", "undo_post", "redo_post"):
+            self.assertIn(handler, getattr(bpy.app.handlers, name))
+
+        job = JobBuilder("HandlerJob").build()
+        job.custom_bake_channels.add().name = "Channel_A"
+        job.setting.bake_type = 'BASIC'
+        self.assertTrue(prop_module._CHANNEL_SYNC_STATE)
+        get_channel_source_items(job.custom_bake_channels[0].r_settings, bpy.context)
+        self.assertTrue(prop_module._SOURCE_ITEMS_CACHE)
+
+        handler(bpy.context.scene)
+        self.assertFalse(prop_module._SOURCE_ITEMS_CACHE)
+        self.assertFalse(prop_module._CHANNEL_SYNC_STATE)
+
 if __name__ == "__main__":
     unittest.main()
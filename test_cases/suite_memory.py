@@ -5,6 +5,8 @@ prevents data leaks in BakeNexus operations.
 """
 
 import unittest
+from types import SimpleNamespace
+from unittest import mock
 import bpy
 from .helpers import (
     cleanup_scene,
@@ -277,6 +279,40 @@ class SuiteMemoryIntegration(unittest.TestCase):
 
         self.assertLessEqual(leaked, 1, f"Images leaked after batch delete: {leaked}")
 
+    def test_step_frees_and_tracks_every_result(self):
+        """Every result of a multi-channel step is freed and tracked, not just the last."""
+        from ..core import execution
+
+        images = [mock.MagicMock(name=f"Img_{i}") for i in range(3)]
+        results = [
+            {"image": img, "type": f"C{i}", "obj": "Obj", "path": f"/tmp/c{i}_0001.png"}
+            for i, img in enumerate(images)
+        ]
+
+        op = execution.BakeModalOperator()
+        op.total_steps = 1
+        step = SimpleNamespace(
+            job=None,
+            task=SimpleNamespace(base_name="Obj"),
+            frame_info={"frame": 1, "save_idx": 1},
+        )
+
+        runner = mock.MagicMock()
+        runner.return_value.run.return_value = results
+        with mock.patch.object(execution, "BakeStepRunner", runner), mock.patch.object(
+            execution, "add_bake_result_to_ui"
+        ) as add_ui, mock.patch.object(
+            execution.compat, "is_blender_5", return_value=False
+        ):
+            op._process_single_step(bpy.context, step)
+
+        self.assertEqual(add_ui.call_count, len(images))
+        for img in images:
+            img.gl_free.assert_called_once()
+            img.buffers_free.assert_called_once()
+            self.assertIn(img, op.sequence_tracking)
+            self.assertEqual(op.sequence_tracking[img]["count"], 1)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,10 +1,17 @@
 
 """Preset serialization round-trip tests."""
+import json
+import os
+import tempfile
+import time
 import unittest
+from io import StringIO
+from unittest import mock
 import bpy
 from bpy import props
 from .helpers import cleanup_scene, create_test_object, JobBuilder, ensure_cycles
-from ..preset_handler import PropertyIO, load_preset_into_jobs_manager
+from .. import preset_handler
+from ..preset_handler import PropertyIO, load_preset_into_jobs_manager, save_preset_file
 from ..state_manager import BakeStateManager
 from ..core.common import reset_channels_logic
 
@@ -59,6 +66,160 @@ class SuitePresetAndState(unittest.TestCase):
         self.assertEqual(s.res_y, 256)
         self.assertEqual(s.sample, 4)
 
+    def test_to_stream_matches_to_dict(self):
+        """Streamed JSON must decode to the same document as to_dict."""
+        obj = create_test_object("StreamObj")
+        builder = JobBuilder("StreamJob")
+        builder.add_objects(obj).mode('SINGLE_OBJECT').type('BSDF')
+        builder.enable_channel('color')
+
+        job = bpy.context.scene.BakeJobs.jobs[0]
+        buf = StringIO()
+        PropertyIO().to_stream(job, buf)
+
+        expected = json.loads(json.dumps(PropertyIO().to_dict(job)))
+        self.assertEqual(json.loads(buf.getvalue()), expected)
+
+    def test_save_preset_file_is_atomic(self):
+        """save_preset_file writes valid JSON and leaves no temp file behind."""
+        builder = JobBuilder("AtomicJob")
+        builder.setting.res_x = 640
+        job = bpy.context.scene.BakeJobs.jobs[0]
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "preset.json")
+            save_preset_file(path, job)
+
+            self.assertFalse(os.path.exists(path + ".tmp"))
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        self.assertEqual(data['setting']['res_x'], 640)
+
+    def test_skip_defaults_export_is_sparse_and_roundtrips(self):
+        """Sparse exports drop default scalars and still restore them on load."""
+        builder = JobBuilder("SparseJob")
+        builder.setting.res_x = 640
+        job = bpy.context.scene.BakeJobs.jobs[0]
+        default_res_y = job.setting.bl_rna.properties['res_y'].default
+
+        data = PropertyIO(skip_defaults=True).to_dict(job)
+        self.assertEqual(data['setting']['res_x'], 640)
+        self.assertNotIn('res_y', data['setting'])
+
+        job.setting.res_y = default_res_y + 7
+        PropertyIO(skip_defaults=True).from_dict(job, data)
+        self.assertEqual(job.setting.res_x, 640)
+        self.assertEqual(job.setting.res_y, default_res_y)
+
+    def test_skip_defaults_resets_all_default_subgroup(self):
+        """An all-default sub-group exported as {} still resets the target on load."""
+        builder = JobBuilder("SparseGroupJob")
+        builder.enable_channel('normal')
+        chan = bpy.context.scene.BakeJobs.jobs[0].setting.channels[0]
+        ns = chan.normal_settings
+        for key in ("type", "X", "Y", "Z", "object_space"):
+            ns.property_unset(key)
+
+        data = PropertyIO(skip_defaults=True).to_dict(chan)
+        self.assertEqual(data['normal_settings'], {})
+
+        ns.type = 'DIRECTX'
+        ns.Y = 'NEG_Y'
+        ns.object_space = True
+        PropertyIO(skip_defaults=True).from_dict(chan, data)
+
+        self.assertEqual(ns.type, 'OPENGL')
+        self.assertEqual(ns.Y, 'POS_Y')
+        self.assertFalse(ns.object_space)
+
+    def test_skip_defaults_keeps_migrated_legacy_keys(self):
+        """Legacy keys migrated onto same-level targets survive the sparse reset."""
+        JobBuilder("LegacySparseJob")
+        setting = bpy.context.scene.BakeJobs.jobs[0].setting
+        data = {"colorbase": [0.2, 0.4, 0.6, 1.0], "save_format": "JPEG"}
+
+        PropertyIO(skip_defaults=True).from_dict(setting, data)
+
+        self.assertAlmostEqual(setting.color_base[1], 0.4, places=5)
+        self.assertEqual(setting.external_save_format, "JPEG")
+
+    def test_skip_defaults_reset_syncs_channels_and_honours_filter(self):
+        """Resetting an omitted bake_type rebuilds channels; filtered keys are left alone."""
+        builder = JobBuilder("SparseSyncJob").type('BASIC')
+        setting = builder.setting
+        setting.res_y = 333
+        self.assertIn("diff", [c.id for c in setting.channels])
+
+        io = PropertyIO(
+            skip_defaults=True, custom_filter=lambda _group, key: key != "res_y"
+        )
+        io.from_dict(setting, {"res_x": 640})
+
+        self.assertEqual(setting.bake_type, "BSDF")
+        ids = [c.id for c in setting.channels]
+        self.assertIn("color", ids)
+        self.assertNotIn("diff", ids)
+        self.assertEqual(setting.res_y, 333)
+
+    def _run_async_io(self, start):
+        """Call start() with timers captured, then poll them until they finish."""
+        polls = []
+        with mock.patch.object(
+            preset_handler.bpy.app.timers,
+            "register",
+            side_effect=lambda fn, **_kw: polls.append(fn),
+        ):
+            start()
+        self.assertEqual(len(polls), 1)
+        deadline = time.time() + 10.0
+        while polls[0]() is not None:
+            self.assertLess(time.time(), deadline, "preset worker never finished")
+            time.sleep(0.01)
+
+    def test_async_save_reports_success_and_error(self):
+        """save_preset_file_async hands None or the write error to on_done."""
+        JobBuilder("AsyncSaveJob").setting.res_x = 640
+        job = bpy.context.scene.BakeJobs.jobs[0]
+        outcomes = []
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "async.json")
+            self._run_async_io(
+                lambda: preset_handler.save_preset_file_async(path, job, outcomes.append)
+            )
+            self.assertIsNone(outcomes[-1])
+            with open(path, "r", encoding="utf-8") as f:
+                self.assertEqual(json.load(f)["setting"]["res_x"], 640)
+
+            bad_path = os.path.join(tmp_dir, "missing_dir", "async.json")
+            self._run_async_io(
+                lambda: preset_handler.save_preset_file_async(bad_path, job, outcomes.append)
+            )
+            self.assertIsInstance(outcomes[-1], OSError)
+
+    def test_async_load_reports_data_and_error(self):
+        """load_preset_file_async hands parsed data or the read error to on_loaded."""
+        outcomes = []
+
+        def on_loaded(data, error):
+            outcomes.append((data, error))
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            good = os.path.join(tmp_dir, "good.json")
+            bad = os.path.join(tmp_dir, "bad.json")
+            with open(good, "w", encoding="utf-8") as f:
+                json.dump({"name": "AsyncLoaded"}, f)
+            with open(bad, "w", encoding="utf-8") as f:
+                f.write("{not json")
+
+            self._run_async_io(lambda: preset_handler.load_preset_file_async(good, on_loaded))
+            self.assertEqual(outcomes[-1], ({"name": "AsyncLoaded"}, None))
+
+            self._run_async_io(lambda: preset_handler.load_preset_file_async(bad, on_loaded))
+            data, error = outcomes[-1]
+            self.assertIsNone(data)
+            self.assertIsInstance(error, json.JSONDecodeError)
+
     def test_single_job_preset_loads_into_jobs_manager(self):
         """Single-job exports should remain reusable for startup/library presets."""
         obj = create_test_object("SingleJobPresetObj")
@@ -279,5 +440,22 @@ class SuitePresetAndState(unittest.TestCase):
         # res_x is IntProperty, setattr with string should fail and increment stats['error']
         self.assertGreater(io.stats['error'], 0)
 
+    def test_leaf_group_scalar_fast_path(self):
+        """Scalar-only groups load values and count stats like the generic path."""
+        bj = bpy.context.scene.BakeJobs
+        bj.jobs.clear()
+        job = bj.jobs.add()
+        reset_channels_logic(job.setting)
+        mesh = job.setting.channels[0].mesh_settings
+
+        io = PropertyIO()
+        io.from_dict(mesh, {"samples": 32, "radius": 0.25, "bogus": 1, "inside": "x"})
+
+        self.assertEqual(mesh.samples, 32)
+        self.assertAlmostEqual(mesh.radius, 0.25, places=5)
+        self.assertEqual(io.stats['loaded'], 2)
+        self.assertEqual(io.stats['skipped_match'], 1)
+        self.assertEqual(io.stats['error'], 1)
+
 if __name__ == '__main__':
     unittest.main()
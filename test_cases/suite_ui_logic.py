@@ -91,6 +91,49 @@ class SuiteUILogic(unittest.TestCase):
         # Cleanup
         bpy.data.objects.remove(target)
 
+    def test_manage_objects_remove_keeps_survivor_settings(self):
+        """Verify REMOVE drops only selected objects and keeps per-tile data."""
+        scene = bpy.context.scene
+        scene.BakeJobs.jobs.add()
+        s = scene.BakeJobs.jobs[0].setting
+
+        keep = create_test_object("KeepObj")
+        drop = self.obj
+
+        from ..core.common import manage_objects_logic
+        manage_objects_logic(s, 'SET', [keep, drop])
+        s.bake_objects[0].udim_tile = 1005
+        s.bake_objects[0].override_size = True
+        s.bake_objects[0].udim_width = 256
+
+        manage_objects_logic(s, 'REMOVE', [drop])
+
+        self.assertEqual(len(s.bake_objects), 1)
+        survivor = s.bake_objects[0]
+        self.assertEqual(survivor.bakeobject, keep)
+        self.assertEqual(survivor.udim_tile, 1005)
+        self.assertTrue(survivor.override_size)
+        self.assertEqual(survivor.udim_width, 256)
+
+        bpy.data.objects.remove(keep)
+
+    def test_manage_objects_remove_keeps_missing_object_entries(self):
+        """Verify REMOVE keeps entries whose object was deleted but not selected."""
+        scene = bpy.context.scene
+        scene.BakeJobs.jobs.add()
+        s = scene.BakeJobs.jobs[0].setting
+
+        from ..core.common import manage_objects_logic
+        manage_objects_logic(s, 'SET', [self.obj])
+        orphan = s.bake_objects.add()
+        orphan.udim_tile = 1003
+
+        manage_objects_logic(s, 'REMOVE', [self.obj])
+
+        self.assertEqual(len(s.bake_objects), 1)
+        self.assertIsNone(s.bake_objects[0].bakeobject)
+        self.assertEqual(s.bake_objects[0].udim_tile, 1003)
+
     def test_draw_header_no_nameerror(self):
         """Verify draw_header doesn't raise NameError for undefined row."""
         if draw_header is None:
@@ -151,6 +194,26 @@ class SuiteUILogic(unittest.TestCase):
         draw_crash_report(mock_layout, mock_context)
         mock_layout.box.assert_called()
 
+    def test_report_deferred_opens_popup_in_first_window(self):
+        """Verify deferred reports target a window even when the timer context has none."""
+        from .. import ops
+
+        fake_ctx = mock.MagicMock()
+        fake_ctx.window_manager.windows = ["Window0"]
+        with mock.patch.object(ops.bpy, "context", fake_ctx):
+            ops._report_deferred("Import failed: boom", "ERROR")
+        fake_ctx.temp_override.assert_called_once_with(window="Window0")
+        fake_ctx.window_manager.popup_menu.assert_called_once()
+        self.assertEqual(
+            fake_ctx.window_manager.popup_menu.call_args.kwargs["icon"], "ERROR"
+        )
+
+        fake_ctx.reset_mock()
+        fake_ctx.window_manager.windows = []
+        with mock.patch.object(ops.bpy, "context", fake_ctx):
+            ops._report_deferred("Settings imported")
+        fake_ctx.window_manager.popup_menu.assert_not_called()
+
     def test_run_dev_tests_updates_ui_from_isolated_runner(self):
         """Verify the dev test operator uses isolated execution and stores the summary."""
         from ..ops import BAKETOOL_OT_RunDevTests
@@ -646,6 +646,22 @@ class SuiteUnit(unittest.TestCase):
             len(links), count, "Links not restored after NodeGraphHandler exit"
         )
 
+    def test_find_active_output_revalidates_cache(self):
+        """Cached active output is reused, and re-scanned once it goes stale."""
+        from ..core.node_manager import find_active_output
+
+        mat = bpy.data.materials.new("ActiveOutMat")
+        mat.use_nodes = True
+        nodes = mat.node_tree.nodes
+        first = find_active_output(mat)
+        self.assertIsNotNone(first)
+        self.assertEqual(find_active_output(mat), first)
+
+        nodes.remove(first)
+        replacement = nodes.new("ShaderNodeOutputMaterial")
+        replacement.is_active_output = True
+        self.assertEqual(find_active_output(mat), replacement)
+
     def test_uv_layer_manager_temp_cleanup(self):
         """Verify UVLayoutManager cleans up temporary UV layers."""
         obj = create_test_object("UVManagerObj")
@@ -710,6 +726,18 @@ class SuiteUnit(unittest.TestCase):
             self.assertEqual(m.objects, [obj])
             self.assertEqual(m.settings, ms)
 
+    def test_append_error_log_caps_batched_text(self):
+        """Verify a long flushed batch cannot push the error log past its cap."""
+        scene = bpy.context.scene
+        scene.bake_error_log = "old\n" * 1000
+        batch = "\n".join(f"[Error] Step {i}: failure" for i in range(2000))
+
+        common.append_error_log(bpy.context, batch)
+
+        log = scene.bake_error_log
+        self.assertLessEqual(len(log), 8000)
+        self.assertTrue(log.endswith("[Error] Step 1999: failure\n"))
+
 
 if __name__ == "__main__":
     unittest.main()
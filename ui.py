@@ -11,6 +11,7 @@ from typing import Any, Tuple
 from bpy.app.translations import pgettext
 from .constants import (
     FORMAT_SETTINGS,
+    UNKNOWN_FORMAT_SETTINGS,
     CAT_MESH,
     CAT_LIGHT,
     CAT_DATA,
@@ -88,7 +89,7 @@ def draw_image_format_options(
     f_p = f"{prefix}external_save_format"
 
     fmt = getattr(setting, f_p)
-    fs = FORMAT_SETTINGS.get(fmt, {})
+    fs = FORMAT_SETTINGS.get(fmt, UNKNOWN_FORMAT_SETTINGS)
 
     row = layout.row(align=True)
     row.prop(setting, f_p, text="")
@@ -101,7 +102,7 @@ def draw_image_format_options(
         row.prop(setting, t_p, text="")
 
     row = layout.row(align=True)
-    if "depths" in fs and len(fs["depths"]) > 0:
+    if fs["depths"]:
         row.prop(setting, d_p, text="Depth")
 
 
@@ -331,8 +332,8 @@ class BAKE_UL_ObjectList(bpy.types.UIList):
         self, context, layout, data, item, icon, active_data, active_propname, index
     ):
         row = layout.row(align=True)
-        if item.bakeobject:
-            obj = item.bakeobject
+        obj = item.bakeobject
+        if obj:
             has_uv = True
             if obj.type == "MESH":
                 has_uv = len(obj.data.uv_layers) > 0
@@ -344,24 +345,18 @@ class BAKE_UL_ObjectList(bpy.types.UIList):
             row.label(text=pgettext("Missing"), icon="ERROR")
 
         # Contextual UI for Custom UDIM
-        scene = context.scene
-        if (
-            hasattr(scene, "BakeJobs")
-            and scene.BakeJobs.jobs
-            and 0 <= scene.BakeJobs.job_index < len(scene.BakeJobs.jobs)
-        ):
-            job = scene.BakeJobs.jobs[scene.BakeJobs.job_index]
-            s = job.setting
-            if s.bake_mode == "UDIM":
-                if s.udim_mode in {"CUSTOM", "REPACK"}:
-                    row.prop(item, "udim_tile", text=pgettext("Tile"), emboss=False)
-
-                # Resolution Override UI
-                row.separator()
-                row.prop(item, "override_size", text="", icon="FULLSCREEN_ENTER")
-                if item.override_size:
-                    row.prop(item, "udim_width", text="W")
-                    row.prop(item, "udim_height", text="H")
+        # 'data' is the BakeJobSetting that owns the list, so there is no
+        # need to walk scene.BakeJobs for every drawn row.
+        if data.bake_mode == "UDIM":
+            if data.udim_mode in {"CUSTOM", "REPACK"}:
+                row.prop(item, "udim_tile", text=pgettext("Tile"), emboss=False)
+
+            # Resolution Override UI
+            row.separator()
+            row.prop(item, "override_size", text="", icon="FULLSCREEN_ENTER")
+            if item.override_size:
+                row.prop(item, "udim_width", text="W")
+                row.prop(item, "udim_height", text="H")
 
 
 class BAKE_UL_ChannelList(bpy.types.UIList):
@@ -435,6 +430,31 @@ class BAKE_UL_BakedImageResults(bpy.types.UIList):
             row.label(text=f"{item.res_x}x{item.res_y}", icon="NONE")
 
 
+# Export format -> (bpy.ops submodule, operator name) of its exporter
+_EXPORTER_OPS = {
+    "FBX": ("export_scene", "fbx"),
+    "GLB": ("export_scene", "gltf"),
+    "USD": ("wm", "usd_export"),
+}
+_exporters_found = set()
+
+
+def _has_exporter(export_format: str) -> bool:
+    """Return whether the exporter operator for a model format is registered.
+
+    hasattr() on bpy.ops performs an operator lookup, so a hit is remembered
+    for the session. Misses are re-checked on each draw so the warning clears
+    as soon as the exporter add-on is enabled.
+    """
+    if export_format in _exporters_found:
+        return True
+    op = _EXPORTER_OPS.get(export_format)
+    if op and hasattr(getattr(bpy.ops, op[0]), op[1]):
+        _exporters_found.add(export_format)
+        return True
+    return False
+
+
 def draw_env_status(layout: bpy.types.UILayout, setting: Any) -> None:
     """Check for and display environment issues (missing addons, invalid paths).
 
@@ -446,18 +466,7 @@ def draw_env_status(layout: bpy.types.UILayout, setting: Any) -> None:
 
     # 1. Check Export Addons
     if setting.export_model:
-        op_map = {"FBX": "fbx", "GLB": "gltf", "USD": "usd_export"}
-        target_op = op_map.get(setting.export_format)
-
-        has_addon = False
-        if target_op == "fbx":
-            has_addon = hasattr(bpy.ops.export_scene, "fbx")
-        elif target_op == "gltf":
-            has_addon = hasattr(bpy.ops.export_scene, "gltf")
-        elif target_op == "usd_export":
-            has_addon = hasattr(bpy.ops.wm, "usd_export")
-
-        if not has_addon:
+        if not _has_exporter(setting.export_format):
             box = layout.box()
             box.alert = True
             row = box.row()
@@ -736,8 +745,9 @@ class BAKE_PT_BakePanel(bpy.types.Panel):
             "baketool.reset_channels", icon="FILE_REFRESH", text=""
         )
 
-        if s.channels and 0 <= s.active_channel_index < len(s.channels):
-            draw_active_channel_properties(col, s.channels[s.active_channel_index], s)
+        channel = s.active_channel
+        if channel:
+            draw_active_channel_properties(col, channel, s)
 
         r = col.row(align=True)
         r.scale_y = 0.8
@@ -881,10 +891,8 @@ class BAKE_PT_BakePanel(bpy.types.Panel):
             )
             draw_template_list_ops(r.column(align=True), "job_custom_channel")
 
-            if j.custom_bake_channels and 0 <= j.custom_bake_channels_index < len(
-                j.custom_bake_channels
-            ):
-                c = j.custom_bake_channels[j.custom_bake_channels_index]
+            c = j.active_custom_channel
+            if c:
                 cfg = sub.column(align=True)
                 cfg.prop(c, "name")
 